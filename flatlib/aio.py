@@ -0,0 +1,209 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+    Author: João Ventura (flatangleweb@gmail.com)
+
+
+    This module implements coroutine wrappers for
+    computing charts, primary direction tables and
+    planetary hour tables from an asyncio event loop.
+
+    The computations run in a pool of workers, so that
+    the event loop is never blocked. Identical requests
+    which are in progress are computed only once and
+    their callers receive the same result object, which
+    should not be changed.
+
+    Usage:
+        chart = await aio.achart(date, pos, hsys=...)
+        table = await aio.apdtable(chart)
+
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .chart import Chart
+from .predictives.primarydirections import PDTable
+from .tools import planetarytime
+from . import const
+
+# Default maximum number of jobs in the pool
+MAX_PENDING = 64
+
+
+# === Request keys === #
+
+def _hashable(value):
+    """ Returns a hashable version of an argument. """
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for (k, v) in value.items()))
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return id(value)
+
+
+def _dateKey(date):
+    """ Returns the key of a Datetime. """
+    return (date.jd, date.utcoffset.value)
+
+
+def _posKey(pos):
+    """ Returns the key of a GeoPos. """
+    return (pos.lat, pos.lon)
+
+
+# ------------------------ #
+#   ChartService Class     #
+# ------------------------ #
+
+class ChartService:
+    """ This class represents a service which computes
+    charts and tables in a pool of workers for an
+    asyncio event loop.
+
+    The pool is a thread pool by default, but any
+    executor can be given, such as a process pool.
+    At most 'maxPending' jobs are submitted to the
+    pool and other requests wait in a queue.
+
+    """
+
+    def __init__(self, executor=None, maxPending=MAX_PENDING):
+        self.executor = executor or ThreadPoolExecutor()
+        self.maxPending = maxPending
+        self._inflight = {}
+        self._semaphore = None
+        self._loop = None
+        self._waiting = 0
+        self._running = 0
+        self._coalesced = 0
+        self._completed = 0
+
+    # === Jobs === #
+
+    async def _run(self, func, args, kwargs):
+        """ Runs a job in the pool when there is room. """
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._running += 1
+        try:
+            return await self._loop.run_in_executor(
+                self.executor, functools.partial(func, *args, **kwargs)
+            )
+        finally:
+            self._running -= 1
+            self._completed += 1
+            self._semaphore.release()
+
+    async def submit(self, key, func, *args, **kwargs):
+        """ Returns the result of a function computed in
+        the pool. Requests with the same key which are in
+        progress share the same job.
+
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Queues and jobs belong to a single event loop
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.maxPending)
+            self._inflight = {}
+        try:
+            future = self._inflight[key]
+            self._coalesced += 1
+        except KeyError:
+            future = asyncio.ensure_future(self._run(func, args, kwargs))
+            self._inflight[key] = future
+            future.add_done_callback(
+                lambda f: self._inflight.pop(key, None)
+            )
+        # Cancelling a caller must not cancel the job
+        return await asyncio.shield(future)
+
+    # === Coroutines === #
+
+    async def achart(self, date, pos, **kwargs):
+        """ Returns a Chart for a date and position. """
+        key = ('chart', _dateKey(date), _posKey(pos), _hashable(kwargs))
+        return await self.submit(key, Chart, date, pos, **kwargs)
+
+    async def apdtable(self, chart, aspList=const.MAJOR_ASPECTS):
+        """ Returns the PDTable of a chart. """
+        key = ('pdtable', id(chart), _hashable(aspList))
+        return await self.submit(key, PDTable, chart, aspList)
+
+    async def ahourtable(self, date, pos):
+        """ Returns the HourTable of a date and position. """
+        key = ('hourtable', _dateKey(date), _posKey(pos))
+        return await self.submit(key, planetarytime.getHourTable,
+                                 date, pos)
+
+    # === Metrics === #
+
+    def metrics(self):
+        """ Returns a dict with the number of requests
+        waiting for the pool, running in the pool and in
+        progress, together with the total number of
+        coalesced and completed requests.
+
+        """
+        return {
+            'waiting': self._waiting,
+            'running': self._running,
+            'inflight': len(self._inflight),
+            'coalesced': self._coalesced,
+            'completed': self._completed
+        }
+
+    def shutdown(self, wait=True):
+        """ Shuts down the pool of workers. """
+        self.executor.shutdown(wait=wait)
+
+
+# === Default service === #
+
+_SERVICE = None
+
+
+def getService():
+    """ Returns the default service, which is
+    created on first use.
+
+    """
+    global _SERVICE
+    if _SERVICE is None:
+        _SERVICE = ChartService()
+    return _SERVICE
+
+
+def setService(service):
+    """ Sets the default service. """
+    global _SERVICE
+    _SERVICE = service
+
+
+async def achart(date, pos, **kwargs):
+    """ Returns a Chart using the default service. """
+    return await getService().achart(date, pos, **kwargs)
+
+
+async def apdtable(chart, aspList=const.MAJOR_ASPECTS):
+    """ Returns a PDTable using the default service. """
+    return await getService().apdtable(chart, aspList)
+
+
+async def ahourtable(date, pos):
+    """ Returns an HourTable using the default service. """
+    return await getService().ahourtable(date, pos)
+
+
+def metrics():
+    """ Returns the metrics of the default service. """
+    return getService().metrics()
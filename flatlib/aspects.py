@@ -200,41 +200,58 @@ def _getActivePassive(obj1, obj2):
 
 # === Public functions === #
 
-def aspectType(obj1, obj2, aspList):
+def _inMatrix(matrix, obj1, obj2, aspList):
+    """ Returns if the aspect between two objects can
+    be read from an aspect matrix. 
+    
+    """
+    return (matrix is not None and
+            matrix.aspList == list(aspList) and
+            matrix.objects.get(obj1.id) is obj1 and
+            matrix.objects.get(obj2.id) is obj2)
+
+
+def aspectType(obj1, obj2, aspList, matrix=None):
     """ Returns the aspect type between objects considering
     a list of possible aspect types.
     
     """
+    if _inMatrix(matrix, obj1, obj2, aspList):
+        return matrix.aspectType(obj1.id, obj2.id)
     ap = _getActivePassive(obj1, obj2)
     aspDict = _aspectDict(ap['active'], ap['passive'], aspList)
     return aspDict['type'] if aspDict else const.NO_ASPECT
 
 
-def hasAspect(obj1, obj2, aspList):
+def hasAspect(obj1, obj2, aspList, matrix=None):
     """ Returns if there is an aspect between objects 
     considering a list of possible aspect types.
     
     """
-    aspType = aspectType(obj1, obj2, aspList)
+    aspType = aspectType(obj1, obj2, aspList, matrix)
     return aspType != const.NO_ASPECT
 
 
-def isAspecting(obj1, obj2, aspList):
+def isAspecting(obj1, obj2, aspList, matrix=None):
     """ Returns if obj1 aspects obj2 within its orb,
     considering a list of possible aspect types. 
     
     """
+    if _inMatrix(matrix, obj1, obj2, aspList):
+        return matrix.isAspecting(obj1.id, obj2.id)
     aspDict = _aspectDict(obj1, obj2, aspList)
     if aspDict:
         return aspDict['orb'] < obj1.orb()
     return False
 
 
-def getAspect(obj1, obj2, aspList):
+def getAspect(obj1, obj2, aspList, matrix=None):
     """ Returns an Aspect object for the aspect between two
     objects considering a list of possible aspect types.
     
     """
+    if _inMatrix(matrix, obj1, obj2, aspList):
+        return matrix.getAspect(obj1.id, obj2.id)
     ap = _getActivePassive(obj1, obj2)
     aspDict = _aspectDict(ap['active'], ap['passive'], aspList)
     if not aspDict:
@@ -333,3 +350,125 @@ class Aspect:
                                      self.type,
                                      self.active.movement,
                                      angle.toString(self.orb))
+
+
+# ---------------------- #
+#   AspectMatrix Class   #
+# ---------------------- #
+
+class AspectMatrix:
+    """ This class represents the aspects between all
+    pairs of objects of a list, considering a list of
+    possible aspect types.
+
+    Separations, orbs and aspect types are computed
+    once for all pairs. Aspect objects, with the 
+    movements and orbs of both objects, are built 
+    when first requested.
+
+    """
+
+    def __init__(self, objects, aspList):
+        self.aspList = list(aspList)
+        self.objects = dict((obj.id, obj) for obj in objects)
+        self.aspects = {}
+        self._speeds = {}
+        self._aspectDicts = {}
+        self._build()
+
+    def _build(self):
+        """ Computes the aspect dicts of all ordered 
+        pairs of objects, in the same way as 
+        _aspectDict().
+
+        """
+        objects = list(self.objects.values())
+        values = [(obj.id, obj.lon, obj.orb()) for obj in objects]
+        for obj in objects:
+            speed = abs(obj.lonspeed) if obj.isPlanet() else -1.0
+            self._speeds[obj.id] = speed
+
+        conjOnly = [const.PARS_FORTUNA, const.NORTH_NODE,
+                    const.SOUTH_NODE]
+        for (id1, lon1, orb1) in values:
+            if id1 == const.SYZYGY:
+                continue
+            aspList = self.aspList
+            if id1 in conjOnly:
+                aspList = [asp for asp in aspList
+                           if asp == const.CONJUNCTION]
+
+            for (id2, lon2, orb2) in values:
+                if id1 == id2:
+                    continue
+                sep = angle.closestdistance(lon1, lon2)
+                absSep = abs(sep)
+                for asp in aspList:
+                    orb = abs(absSep - asp)
+                    if asp in const.MAJOR_ASPECTS:
+                        if orb1 < orb and orb2 < orb:
+                            continue
+                    elif MAX_MINOR_ASP_ORB < orb:
+                        continue
+                    self._aspectDicts[(id1, id2)] = {
+                        'type': asp,
+                        'orb': orb,
+                        'separation': sep
+                    }
+                    break
+
+    def _activePassive(self, id1, id2):
+        """ Returns the IDs of the active and passive
+        objects. 
+        
+        """
+        if self._speeds[id1] > self._speeds[id2]:
+            return (id1, id2)
+        return (id2, id1)
+
+    def aspectDict(self, id1, id2):
+        """ Returns the type, orb and separation of the
+        aspect of id1 to id2, or None if there is no 
+        aspect.
+        
+        """
+        return self._aspectDicts.get((id1, id2))
+
+    def aspectType(self, id1, id2):
+        """ Returns the aspect type between two objects. """
+        aspDict = self.aspectDict(*self._activePassive(id1, id2))
+        return aspDict['type'] if aspDict else const.NO_ASPECT
+
+    def hasAspect(self, id1, id2):
+        """ Returns if there is an aspect between two objects. """
+        return self.aspectType(id1, id2) != const.NO_ASPECT
+
+    def isAspecting(self, id1, id2):
+        """ Returns if id1 aspects id2 within its orb. """
+        aspDict = self.aspectDict(id1, id2)
+        if aspDict:
+            return aspDict['orb'] < self.objects[id1].orb()
+        return False
+
+    def getAspect(self, id1, id2):
+        """ Returns an Aspect object for the aspect 
+        between two objects.
+        
+        """
+        key = self._activePassive(id1, id2)
+        try:
+            return self.aspects[key]
+        except KeyError:
+            aspDict = self.aspectDict(*key)
+            if not aspDict:
+                aspDict = {
+                    'type': const.NO_ASPECT,
+                    'orb': 0,
+                    'separation': 0,
+                }
+            active = self.objects[key[0]]
+            passive = self.objects[key[1]]
+            aspProp = _aspectProperties(active, passive, aspDict)
+            asp = Aspect(aspProp)
+            self.aspects[key] = asp
+            return asp
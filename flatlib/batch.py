@@ -0,0 +1,110 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+    Author: João Ventura (flatangleweb@gmail.com)
+
+
+    This module implements the computation of charts
+    for large datasets using a pool of processes.
+
+    Inputs are rows of (date, time, utcoffset, lat, lon)
+    or a table with a column for each of these values,
+    in the formats accepted by Datetime and GeoPos. The
+    rows are split in chunks which are computed by the
+    worker processes, and the results are returned in
+    the same order as compact records:
+
+    - objects: dict of ID to (lon, lat, lonspeed, latspeed)
+    - houses: list with the longitudes of the 12 houses
+    - angles: dict of ID to longitude
+
+"""
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from . import const
+from .chart import Chart
+from .datetime import Datetime
+from .geopos import GeoPos
+from .ephem import swe
+
+# Columns of input tables
+COLUMNS = ['date', 'time', 'utcoffset', 'lat', 'lon']
+
+# Default number of rows per chunk
+CHUNK_SIZE = 256
+
+# Chunks waiting for results, for each worker
+PENDING_CHUNKS = 2
+
+
+# === Workers === #
+
+def _initWorker(path):
+    """ Initializes a worker process. """
+    swe.setPath(path)
+
+
+def _chartRecord(chart):
+    """ Returns the compact record of a chart. """
+    return {
+        'objects': dict(
+            (obj.id, (obj.lon, obj.lat, obj.lonspeed, obj.latspeed))
+            for obj in chart.objects
+        ),
+        'houses': [house.lon for house in chart.houses],
+        'angles': dict((obj.id, obj.lon) for obj in chart.angles)
+    }
+
+
+def _computeChunk(rows, IDs, hsys):
+    """ Returns the records of a chunk of rows. """
+    res = []
+    for (date, time, utcoffset, lat, lon) in rows:
+        chart = Chart(Datetime(date, time, utcoffset),
+                      GeoPos(lat, lon),
+                      IDs=IDs, hsys=hsys)
+        res.append(_chartRecord(chart))
+    return res
+
+
+# === Public functions === #
+
+def rows(data):
+    """ Returns an iterator over the rows of a dataset,
+    which can be an iterable of rows or a dict with the
+    input columns.
+
+    """
+    if isinstance(data, dict):
+        return zip(*[data[column] for column in COLUMNS])
+    return iter(data)
+
+
+def computeCharts(data, IDs=const.LIST_OBJECTS_TRADITIONAL,
+                  hsys=const.HOUSES_DEFAULT, workers=None,
+                  chunkSize=CHUNK_SIZE):
+    """ Computes the charts of a dataset in a pool of
+    worker processes and yields their records in the
+    order of the dataset.
+
+    The number of workers defaults to the number of
+    CPUs. Only a few chunks are pending at any time,
+    so that datasets are read as results are consumed.
+
+    """
+    workers = workers or os.cpu_count() or 1
+    iterator = rows(data)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunkSize)), [])
+    with ProcessPoolExecutor(workers, initializer=_initWorker,
+                             initargs=(swe.getPath(),)) as executor:
+        pending = deque()
+        for chunk in chunks:
+            future = executor.submit(_computeChunk, chunk, IDs, hsys)
+            pending.append(future)
+            if len(pending) >= workers * PENDING_CHUNKS:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
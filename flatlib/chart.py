@@ -18,13 +18,24 @@
     
     There are also methods to access fixed stars.
     
+    The LazyChart class has the same interface but only
+    computes objects, houses and angles when needed.
+    
+    Charts keep the ephemeris context and the dignity
+    configuration in which they were created, so that 
+    charts with different configurations can be used 
+    by concurrent threads.
+    
 """
 
 from . import angle
+from . import aspects
 from . import const
 from . import utils
 from .ephem import ephem
+from .ephem import context
 from .datetime import Datetime
+from .lists import ObjectList
 
 
 # ------------------ #
@@ -41,17 +52,24 @@ class Chart:
         Optional arguments are:
         - hsys: house system
         - IDs: list of objects to include
+        - context: ephemeris context
+        - config: essential dignities configuration
         
         """
         # Handle optional arguments
-        hsys = kwargs.get('hsys', const.HOUSES_DEFAULT)
+        ctx = kwargs.get('context', context.current())
+        hsys = kwargs.get('hsys', ctx.hsys)
         IDs = kwargs.get('IDs', const.LIST_OBJECTS_TRADITIONAL)
 
         self.date = date
         self.pos = pos
         self.hsys = hsys
-        self.objects = ephem.getObjectList(IDs, date, pos)
-        self.houses, self.angles = ephem.getHouses(date, pos, hsys)
+        self.context = ctx
+        self.config = kwargs.get('config', None)
+        with ctx:
+            self.objects = ephem.getObjectList(IDs, date, pos, hsys)
+            self.houses, self.angles = ephem.getHouses(date, pos, hsys)
+        self._aspectMatrices = {}
 
     def copy(self):
         """ Returns a deep copy of this chart. """
@@ -59,9 +77,12 @@ class Chart:
         chart.date = self.date
         chart.pos = self.pos
         chart.hsys = self.hsys
+        chart.context = self.context
+        chart.config = self.config
         chart.objects = self.objects.copy()
         chart.houses = self.houses.copy()
         chart.angles = self.angles.copy()
+        chart._aspectMatrices = {}
         return chart
 
     # === Properties === #
@@ -83,27 +104,50 @@ class Chart:
         from the chart.
         
         """
-        if ID.startswith('House'):
+        if ID in const.HOUSE_INDEX:
             return self.getHouse(ID)
-        elif ID in const.LIST_ANGLES:
+        elif ID in const.ANGLE_INDEX:
             return self.getAngle(ID)
         else:
             return self.getObject(ID)
 
     # === Fixed stars === #
 
-    # The computation of fixed stars is inefficient,
-    # so the access must be made directly to the
-    # ephemeris only when needed.
+    # Fixed stars are not part of the chart, so the
+    # access is made directly to the ephemeris only 
+    # when needed.
 
     def getFixedStar(self, ID):
         """ Returns a fixed star from the ephemeris. """
-        return ephem.getFixedStar(ID, self.date)
+        with self.context:
+            return ephem.getFixedStar(ID, self.date)
 
     def getFixedStars(self):
         """ Returns a list with all fixed stars. """
         IDs = const.LIST_FIXED_STARS
-        return ephem.getFixedStarList(IDs, self.date)
+        with self.context:
+            return ephem.getFixedStarList(IDs, self.date)
+
+    # === Aspects === #
+
+    def getAspectMatrix(self, aspList):
+        """ Returns the aspect matrix between the chart's
+        objects for a list of possible aspects. 
+        
+        Matrices are cached by aspect list and rebuilt 
+        when objects are relocated or replaced.
+        
+        """
+        objects = list(self.objects)
+        signature = [(obj, obj.lon, getattr(obj, 'lonspeed', 0.0))
+                     for obj in objects]
+        key = tuple(aspList)
+        cached = self._aspectMatrices.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+        matrix = aspects.AspectMatrix(objects, aspList)
+        self._aspectMatrices[key] = (signature, matrix)
+        return matrix
 
     # === Houses and angles === #
 
@@ -160,5 +204,128 @@ class Chart:
         date = Datetime('{0}/01/01'.format(year),
                         '00:00',
                         self.date.utcoffset)
-        srDate = ephem.nextSolarReturn(date, sun.lon)
-        return Chart(srDate, self.pos, hsys=self.hsys)
+        with self.context:
+            srDate = ephem.nextSolarReturn(date, sun.lon)
+        return self.__class__(srDate, self.pos, hsys=self.hsys,
+                              context=self.context, config=self.config)
+
+
+# ------------------ #
+#  Lazy Chart Class  #
+# ------------------ #
+
+class LazyChart(Chart):
+    """ This class represents an astrology chart which
+    computes each object, and the houses and angles, 
+    only when they are first accessed.
+    
+    It is useful when only a few objects are needed,
+    since objects such as the Syzygy are expensive.
+    
+    """
+
+    def __init__(self, date, pos, **kwargs):
+        """ Creates a lazy astrology chart for a given
+        date and location. Optional arguments are the 
+        same of the Chart class.
+        
+        """
+        ctx = kwargs.get('context', context.current())
+        hsys = kwargs.get('hsys', ctx.hsys)
+        IDs = kwargs.get('IDs', const.LIST_OBJECTS_TRADITIONAL)
+
+        self.date = date
+        self.pos = pos
+        self.hsys = hsys
+        self.context = ctx
+        self.config = kwargs.get('config', None)
+        self.IDs = list(IDs)
+        self._objects = ObjectList([])
+        self._complete = False
+        self._houses = None
+        self._angles = None
+        self._aspectMatrices = {}
+
+    # === Lazy properties === #
+
+    @property
+    def objects(self):
+        """ Returns the list with all the chart's objects. """
+        if not self._complete:
+            content = self._objects.content
+            missing = [ID for ID in self.IDs if ID not in content]
+            with self.context:
+                objList = ephem.getObjectList(missing, self.date,
+                                              self.pos, self.hsys)
+            for obj in objList:
+                content[obj.id] = obj
+            self._objects = ObjectList([content[ID] for ID in self.IDs])
+            self._complete = True
+        return self._objects
+
+    @objects.setter
+    def objects(self, objects):
+        self._objects = objects
+        self._complete = True
+
+    def _computeHouses(self):
+        """ Computes the chart's houses and angles. """
+        with self.context:
+            self._houses, self._angles = ephem.getHouses(self.date,
+                                                         self.pos,
+                                                         self.hsys)
+
+    @property
+    def houses(self):
+        """ Returns the list with the chart's houses. """
+        if self._houses is None:
+            self._computeHouses()
+        return self._houses
+
+    @houses.setter
+    def houses(self, houses):
+        self._houses = houses
+
+    @property
+    def angles(self):
+        """ Returns the list with the chart's angles. """
+        if self._angles is None:
+            self._computeHouses()
+        return self._angles
+
+    @angles.setter
+    def angles(self, angles):
+        self._angles = angles
+
+    # === Properties === #
+
+    def getObject(self, ID):
+        """ Returns an object from the chart. """
+        try:
+            return self._objects.get(ID)
+        except KeyError:
+            if self._complete or ID not in self.IDs:
+                raise
+        with self.context:
+            obj = ephem.getObject(ID, self.date, self.pos, self.hsys)
+        self._objects.add(obj)
+        return obj
+
+    def copy(self):
+        """ Returns a deep copy of this chart. """
+        chart = LazyChart.__new__(LazyChart)
+        chart.date = self.date
+        chart.pos = self.pos
+        chart.hsys = self.hsys
+        chart.context = self.context
+        chart.config = self.config
+        chart.IDs = list(self.IDs)
+        chart._objects = ObjectList([obj.copy() for obj in self._objects])
+        chart._complete = self._complete
+        chart._houses = None
+        chart._angles = None
+        if self._houses is not None:
+            chart._houses = self._houses.copy()
+            chart._angles = self._angles.copy()
+        chart._aspectMatrices = {}
+        return chart
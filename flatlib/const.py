@@ -110,6 +110,9 @@ STATIONARY = 'Stationary'
 MEAN_MOTION_SUN = 0.9833
 MEAN_MOTION_MOON = 13.1833
 
+# Days of a tropical year
+YEAR = 365.242199
+
 # Object type
 OBJ_PLANET = 'Planet'
 OBJ_HOUSE = 'House'
@@ -289,3 +292,9 @@ LIST_FIXED_STARS = [
     STAR_LESATH, STAR_VEGA, STAR_ALTAIR, STAR_DENEB_ALGEDI,
     STAR_FOMALHAUT, STAR_DENEB_ADIGE, STAR_ACHERNAR,
 ]
+
+# === Integer indexes === */
+
+# Positions of names in the lists above
+HOUSE_INDEX = dict((ID, i) for (i, ID) in enumerate(LIST_HOUSES))
+ANGLE_INDEX = dict((ID, i) for (i, ID) in enumerate(LIST_ANGLES))
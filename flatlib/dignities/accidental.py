@@ -77,8 +77,12 @@ def viaCombusta(obj):
     return 195 < obj.lon < 225
 
 
-def haiz(obj, chart):
-    """ Returns if an object is in Haiz. """
+def haiz(obj, chart, diurnal=None, house=None):
+    """ Returns if an object is in Haiz. The chart's
+    diurnality and the object's house may be given if
+    already known.
+    
+    """
     objGender = obj.gender()
     objFaction = obj.faction()
 
@@ -99,7 +103,7 @@ def haiz(obj, chart):
 
     # Match faction
     factionConformity = False
-    diurnalChart = chart.isDiurnal()
+    diurnalChart = chart.isDiurnal() if diurnal is None else diurnal
 
     if obj.id == const.SUN and not diurnalChart:
         # Sun is in conformity only when above horizon
@@ -114,7 +118,7 @@ def haiz(obj, chart):
             nocturnalFaction = props.house.aboveHorizon
 
         # Get the object's house and match factions
-        objHouse = chart.houses.getObjectHouse(obj)
+        objHouse = house if house else chart.houses.getObjectHouse(obj)
         if (objFaction == const.DIURNAL and objHouse.id in diurnalFaction or
                 objFaction == const.NOCTURNAL and objHouse.id in nocturnalFaction):
             factionConformity = True
@@ -155,18 +159,27 @@ class AccidentalDignity:
     
     """
 
-    def __init__(self, obj, chart):
+    def __init__(self, obj, chart, dyn=None, diurnal=None, houses=None):
         self.obj = obj
         self.chart = chart
-        self.dyn = ChartDynamics(chart)
+        self.dyn = dyn if dyn else ChartDynamics(chart)
         self.scoreProperties = None
 
+        # Chart data which may be shared by the
+        # dignities of all objects (see scoreChart)
+        self._diurnal = diurnal
+        self._houses = houses if houses is not None else {}
+
     # === Houses === #
 
     def house(self):
         """ Returns the object's house. """
-        house = self.chart.houses.getObjectHouse(self.obj)
-        return house
+        try:
+            return self._houses[self.obj.id]
+        except KeyError:
+            house = self.chart.houses.getObjectHouse(self.obj)
+            self._houses[self.obj.id] = house
+            return house
 
     def houseScore(self):
         """ Returns the score of the object's house. """
@@ -263,6 +276,7 @@ class AccidentalDignity:
         
         """
         res = []
+        matrix = self.chart.getAspectMatrix(aspList)
 
         for otherID in IDs:
             # Ignore same 
@@ -271,7 +285,7 @@ class AccidentalDignity:
 
             # Get aspects to the other object
             otherObj = self.chart.getObject(otherID)
-            asp = aspects.getAspect(self.obj, otherObj, aspList)
+            asp = aspects.getAspect(self.obj, otherObj, aspList, matrix)
 
             if asp.type == const.NO_ASPECT:
                 continue
@@ -342,12 +356,14 @@ class AccidentalDignity:
     def isConjNorthNode(self):
         """ Returns if object is conjunct north node. """
         node = self.chart.getObject(const.NORTH_NODE)
-        return aspects.hasAspect(self.obj, node, aspList=[0])
+        matrix = self.chart.getAspectMatrix([0])
+        return aspects.hasAspect(self.obj, node, [0], matrix)
 
     def isConjSouthNode(self):
         """ Returns if object is conjunct south node. """
         node = self.chart.getObject(const.SOUTH_NODE)
-        return aspects.hasAspect(self.obj, node, aspList=[0])
+        matrix = self.chart.getAspectMatrix([0])
+        return aspects.hasAspect(self.obj, node, [0], matrix)
 
     # === Void of Course, Feral and Haiz === #
 
@@ -362,15 +378,19 @@ class AccidentalDignity:
         """
         planets = copy(const.LIST_SEVEN_PLANETS)
         planets.remove(self.obj.id)
+        aspList = const.MAJOR_ASPECTS
+        matrix = self.chart.getAspectMatrix(aspList)
         for otherID in planets:
             otherObj = self.chart.getObject(otherID)
-            if aspects.hasAspect(self.obj, otherObj, const.MAJOR_ASPECTS):
+            if aspects.hasAspect(self.obj, otherObj, aspList, matrix):
                 return False
         return True
 
     def haiz(self):
         """ Returns the object haiz. """
-        return haiz(self.obj, self.chart)
+        if self._diurnal is None:
+            self._diurnal = self.chart.isDiurnal()
+        return haiz(self.obj, self.chart, self._diurnal, self.house())
 
     # === Scores === #
 
@@ -383,7 +403,8 @@ class AccidentalDignity:
         score = {}
 
         # Peregrine
-        isPeregrine = essential.isPeregrine(obj.id, obj.sign, obj.signlon)
+        isPeregrine = essential.isPeregrine(obj.id, obj.sign, obj.signlon,
+                                           self.chart.config)
         score['peregrine'] = -5 if isPeregrine else 0
 
         # Ruler-Ruler and Exalt-Exalt mutual receptions
@@ -477,3 +498,25 @@ class AccidentalDignity:
         if not self.scoreProperties:
             self.scoreProperties = self.getScoreProperties()
         return sum(self.scoreProperties.values())
+
+
+# === Chart scores === #
+
+def scoreChart(chart, IDs=const.LIST_SEVEN_PLANETS):
+    """ Returns the accidental dignity score properties
+    of a list of objects of a chart, indexed by ID.
+    
+    The chart's diurnality, houses, mutual receptions 
+    and aspects are computed only once for all objects.
+    
+    """
+    dyn = ChartDynamics(chart)
+    diurnal = chart.isDiurnal()
+    objList = [chart.getObject(ID) for ID in IDs]
+    houses = chart.houses.getObjectsHouses(objList)
+    res = {}
+    for ID in IDs:
+        accDig = AccidentalDignity(chart.getObject(ID), chart, dyn,
+                                   diurnal=diurnal, houses=houses)
+        res[ID] = accDig.getScoreProperties()
+    return res
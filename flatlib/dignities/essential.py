@@ -9,6 +9,14 @@
     information from the table and to compute scores and
     almutems.
 
+    The terms and faces variants can be set globally 
+    with setTerms() and setFaces(), or given to each
+    function with a DignityConfig.
+
+    The dignities, scores and almutem of each degree are
+    precomputed once for each variant, so that lookups
+    are a single table access.
+
 """
 
 from . import tables
@@ -23,22 +31,39 @@ EGYPTIAN_TERMS = 'Egyptian Terms'
 TETRABIBLOS_TERMS = 'Tetrabiblos Terms'
 LILLY_TERMS = 'Lilly Terms'
 
+# Tables of each variant
+FACE_TABLES = {
+    CHALDEAN_FACES: tables.CHALDEAN_FACES,
+    TRIPLICITY_FACES: tables.TRIPLICITY_FACES
+}
+
+TERM_TABLES = {
+    EGYPTIAN_TERMS: tables.EGYPTIAN_TERMS,
+    TETRABIBLOS_TERMS: tables.TETRABIBLOS_TERMS,
+    LILLY_TERMS: tables.LILLY_TERMS
+}
+
 # Defaults
 FACES = tables.CHALDEAN_FACES
 TERMS = tables.EGYPTIAN_TERMS
 TABLE = tables.ESSENTIAL_DIGNITIES
 
+# Default terms and faces variants
+_VARIANTS = (EGYPTIAN_TERMS, CHALDEAN_FACES)
+
 
 def setFaces(variant):
     """
     Sets the default faces variant
 
     """
-    global FACES
+    global FACES, _VARIANTS
     if variant == CHALDEAN_FACES:
         FACES = tables.CHALDEAN_FACES
     else:
+        variant = TRIPLICITY_FACES
         FACES = tables.TRIPLICITY_FACES
+    _VARIANTS = (_VARIANTS[0], variant)
 
 
 def setTerms(variant):
@@ -47,13 +72,46 @@ def setTerms(variant):
     table.
 
     """
-    global TERMS
+    global TERMS, _VARIANTS
     if variant == EGYPTIAN_TERMS:
         TERMS = tables.EGYPTIAN_TERMS
     elif variant == TETRABIBLOS_TERMS:
         TERMS = tables.TETRABIBLOS_TERMS
     elif variant == LILLY_TERMS:
         TERMS = tables.LILLY_TERMS
+    else:
+        return
+    _VARIANTS = (variant, _VARIANTS[1])
+
+
+# ----------------------- #
+#   DignityConfig Class   #
+# ----------------------- #
+
+class DignityConfig:
+    """ This class represents a configuration of the
+    terms and faces variants, which is used instead
+    of the defaults when given to the functions of
+    this module.
+
+    """
+
+    def __init__(self, terms=EGYPTIAN_TERMS, faces=CHALDEAN_FACES):
+        self.terms = terms
+        self.faces = faces
+        self.TERMS = TERM_TABLES[terms]
+        self.FACES = FACE_TABLES[faces]
+        self.variants = (terms, faces)
+
+
+def _variants(config):
+    """ Returns the terms and faces tables of a 
+    configuration, or the defaults if None.
+
+    """
+    if config is None:
+        return (TERMS, FACES)
+    return (config.TERMS, config.FACES)
 
 
 # === Table properties === #
@@ -103,18 +161,22 @@ def fallDeg(sign):
     return TABLE[sign]['fall'][1]
 
 
-def term(sign, lon):
-    """ Returns the term for a sign and longitude. """
-    terms = TERMS[sign]
+def _term(terms, lon):
+    """ Returns the term for a list of terms of a 
+    sign and a longitude.
+
+    """
     for (ID, a, b) in terms:
         if (a <= lon < b):
             return ID
     return None
 
 
-def face(sign, lon):
-    """ Returns the face for a sign and longitude. """
-    faces = FACES[sign]
+def _face(faces, lon):
+    """ Returns the face for the faces of a sign and
+    a longitude.
+
+    """
     if lon < 10:
         return faces[0]
     elif lon < 20:
@@ -123,11 +185,23 @@ def face(sign, lon):
         return faces[2]
 
 
+def term(sign, lon, config=None):
+    """ Returns the term for a sign and longitude. """
+    TERMS, FACES = _variants(config)
+    return _term(TERMS[sign], lon)
+
+
+def face(sign, lon, config=None):
+    """ Returns the face for a sign and longitude. """
+    TERMS, FACES = _variants(config)
+    return _face(FACES[sign], lon)
+
+
 # === Complex properties === #
 
-def getInfo(sign, lon):
-    """ Returns the complete essential dignities
-    for a sign and longitude.
+def _computeInfo(sign, lon, TERMS, FACES):
+    """ Computes the essential dignities for a sign
+    and longitude from the tables.
 
     """
     return {
@@ -136,27 +210,78 @@ def getInfo(sign, lon):
         'dayTrip': dayTrip(sign),
         'nightTrip': nightTrip(sign),
         'partTrip': partTrip(sign),
-        'term': term(sign, lon),
-        'face': face(sign, lon),
+        'term': _term(TERMS[sign], lon),
+        'face': _face(FACES[sign], lon),
         'exile': exile(sign),
         'fall': fall(sign)
     }
 
 
-def isPeregrine(ID, sign, lon):
+def _computeEntry(sign, lon, TERMS, FACES):
+    """ Computes the essential dignities, the scores
+    of the objects, the almutem and the objects which 
+    are not peregrine for a sign and longitude.
+
+    """
+    info = _computeInfo(sign, lon, TERMS, FACES)
+    scores = {}
+    for (dign, objID) in info.items():
+        scores[objID] = scores.get(objID, 0) + SCORES[dign]
+    res = [None, 0]
+    for ID in const.LIST_SEVEN_PLANETS:
+        sc = scores.get(ID, 0)
+        if sc > res[1]:
+            res = [ID, sc]
+    dignified = frozenset(objID for (dign, objID) in info.items()
+                          if dign not in ['exile', 'fall'])
+    return (info, scores, res[0], dignified)
+
+
+# Entries of each degree of a sign, indexed by the 
+# terms and faces variants and the sign
+_DEGREE_TABLES = {}
+
+
+def _entry(sign, lon, config):
+    """ Returns the entry of a sign and longitude from
+    the degree table of the variants of a configuration.
+
+    """
+    if not 0 <= lon < 30:
+        TERMS, FACES = _variants(config)
+        return _computeEntry(sign, lon, TERMS, FACES)
+    variants = _VARIANTS if config is None else config.variants
+    key = variants + (sign,)
+    try:
+        return _DEGREE_TABLES[key][int(lon)]
+    except KeyError:
+        TERMS, FACES = _variants(config)
+        table = [_computeEntry(sign, deg, TERMS, FACES)
+                 for deg in range(30)]
+        _DEGREE_TABLES[key] = table
+        return table[int(lon)]
+
+
+def getInfo(sign, lon, config=None):
+    """ Returns the complete essential dignities
+    for a sign and longitude.
+
+    """
+    return dict(_entry(sign, lon, config)[0])
+
+
+def isPeregrine(ID, sign, lon, config=None):
     """ Returns if an object is peregrine
     on a sign and longitude.
 
     """
-    info = getInfo(sign, lon)
-    for dign, objID in info.items():
-        if dign not in ['exile', 'fall'] and ID == objID:
-            return False
-    return True
+    return ID not in _entry(sign, lon, config)[3]
 
 
 # === Scores === #
 
+# Scores of each dignity. Call clearTables() after 
+# changing them.
 SCORES = {
     'ruler': 5,
     'exalt': 4,
@@ -170,28 +295,28 @@ SCORES = {
 }
 
 
-def score(ID, sign, lon):
+def score(ID, sign, lon, config=None):
     """ Returns the score of an object on
     a sign and longitude.
 
     """
-    info = getInfo(sign, lon)
-    dignities = [dign for (dign, objID) in info.items() if objID == ID]
-    return sum([SCORES[dign] for dign in dignities])
+    return _entry(sign, lon, config)[1].get(ID, 0)
 
 
-def almutem(sign, lon):
+def almutem(sign, lon, config=None):
     """ Returns the almutem for a given
     sign and longitude.
 
     """
-    planets = const.LIST_SEVEN_PLANETS
-    res = [None, 0]
-    for ID in planets:
-        sc = score(ID, sign, lon)
-        if sc > res[1]:
-            res = [ID, sc]
-    return res[0]
+    return _entry(sign, lon, config)[2]
+
+
+def clearTables():
+    """ Clears the precomputed degree tables, which
+    are rebuilt when needed.
+    
+    """
+    _DEGREE_TABLES.clear()
 
 
 # ----------------------- #
@@ -204,18 +329,19 @@ class EssentialInfo:
 
     """
 
-    def __init__(self, obj):
+    def __init__(self, obj, config=None):
         self.obj = obj
+        self.config = config
         # Include info in instance properties
-        info = getInfo(obj.sign, obj.signlon)
+        info = getInfo(obj.sign, obj.signlon, config)
         self.__dict__.update(info)
         # Add score and almutem
-        self.score = score(obj.id, obj.sign, obj.signlon)
-        self.almutem = almutem(obj.sign, obj.signlon)
+        self.score = score(obj.id, obj.sign, obj.signlon, config)
+        self.almutem = almutem(obj.sign, obj.signlon, config)
 
     def getInfo(self):
         """ Returns the essential dignities for this object. """
-        return getInfo(self.obj.sign, self.obj.signlon)
+        return getInfo(self.obj.sign, self.obj.signlon, self.config)
 
     def getDignities(self):
         """ Returns the dignities belonging to this object. """
@@ -228,4 +354,5 @@ class EssentialInfo:
         """ Returns if this object is peregrine. """
         return isPeregrine(self.obj.id,
                            self.obj.sign,
-                           self.obj.signlon)
+                           self.obj.signlon,
+                           self.config)
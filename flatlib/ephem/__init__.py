@@ -21,3 +21,8 @@ swe.setPath(flatlib.PATH_RES + 'swefiles')
 # Configure swefile path
 def setPath(path):
     swe.setPath(path)
+
+
+# Configure interpolating cache
+def setCache(cache):
+    swe.setCache(cache)
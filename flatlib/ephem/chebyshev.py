@@ -0,0 +1,282 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+    Author: João Ventura (flatangleweb@gmail.com)
+
+
+    This module implements an interpolating cache for
+    object positions.
+
+    Longitudes and latitudes of each object are fitted 
+    with Chebyshev polynomials over fixed windows of days,
+    and speeds are given by the derivatives of the fitted
+    polynomials. Each window is verified against the Swiss
+    Ephemeris and split in halves until the interpolation 
+    error is below a maximum error, so that cached 
+    positions never exceed that error.
+
+    A cache is enabled with swe.setCache() and can be
+    saved to disk and loaded back. Changing the path of
+    the swe files clears the enabled cache.
+
+"""
+
+import json
+import math
+
+from flatlib import angle
+from flatlib import const
+from . import swe
+from . import tools
+
+# Reference epoch for the windows (J2000)
+EPOCH = 2451545.0
+
+# Default window sizes (in days)
+WINDOWS = {
+    const.SUN: 32,
+    const.MOON: 4,
+    const.MERCURY: 8,
+    const.VENUS: 16,
+    const.MARS: 16,
+    const.JUPITER: 32,
+    const.SATURN: 32,
+    const.URANUS: 64,
+    const.NEPTUNE: 64,
+    const.PLUTO: 64,
+    const.CHIRON: 32,
+    const.NORTH_NODE: 32
+}
+
+# Number of coefficients of each polynomial
+DEGREE = 14
+
+# Number of verification points per window
+CHECKS = 256
+
+# Minimum window size when splitting (in days)
+MIN_WINDOW = 0.01
+
+# File format version
+VERSION = 1
+
+
+# === Chebyshev polynomials === #
+
+def _nodes(n):
+    """ Returns the 'n' Chebyshev nodes in [-1, 1]. """
+    return [math.cos(math.pi * (k + 0.5) / n) for k in range(n)]
+
+
+def _fit(values, n):
+    """ Returns the Chebyshev coefficients which fit
+    the 'values' sampled at the 'n' Chebyshev nodes.
+
+    """
+    coeffs = []
+    for j in range(n):
+        total = 0.0
+        for k in range(n):
+            total += values[k] * math.cos(math.pi * j * (k + 0.5) / n)
+        coeffs.append(2.0 * total / n)
+    coeffs[0] /= 2.0
+    return coeffs
+
+
+def _derivative(coeffs, scale):
+    """ Returns the Chebyshev coefficients of the 
+    derivative of a series, multiplied by 'scale'.
+    
+    """
+    n = len(coeffs)
+    res = [0.0] * (n + 1)
+    for k in range(n - 1, 0, -1):
+        res[k - 1] = res[k + 1] + 2 * k * coeffs[k]
+    res[0] /= 2.0
+    return [c * scale for c in res[:n]]
+
+
+def _eval(coeffs, x):
+    """ Evaluates a Chebyshev series at 'x' in [-1, 1]
+    using the Clenshaw algorithm.
+
+    """
+    b1 = b2 = 0.0
+    x2 = 2.0 * x
+    for c in reversed(coeffs[1:]):
+        b1, b2 = x2 * b1 - b2 + c, b1
+    return x * b1 - b2 + coeffs[0]
+
+
+def _unwrap(lons):
+    """ Removes the 360 degree jumps of a sequence of
+    longitudes so that it can be interpolated.
+
+    """
+    res = [lons[0]]
+    for lon in lons[1:]:
+        res.append(res[-1] + angle.closestdistance(res[-1], lon))
+    return res
+
+
+# ------------------------- #
+#   ChebyshevCache Class    #
+# ------------------------- #
+
+class ChebyshevCache:
+    """ This class represents a cache of object positions
+    interpolated with Chebyshev polynomials.
+
+    Segments are fitted on demand, or in advance with
+    the fill() method. Objects without a window are not
+    cached.
+
+    """
+
+    def __init__(self, maxError=tools.MAX_ERROR, windows=WINDOWS,
+                 degree=DEGREE):
+        self.maxError = maxError
+        self.windows = dict(windows)
+        self.degree = degree
+        self.segments = dict((ID, {}) for ID in self.windows)
+
+    def __contains__(self, ID):
+        return ID in self.windows
+
+    # === Fitting === #
+
+    def _fitSegment(self, ID, start, end):
+        """ Fits a segment between two julian dates and
+        returns the list of segments which satisfy the
+        maximum error.
+
+        """
+        n = self.degree
+        mid = (start + end) / 2.0
+        half = (end - start) / 2.0
+
+        # Sample at the nodes in ascending time order
+        xs = list(reversed(_nodes(n)))
+        samples = [swe.sweDefaultLonLat(ID, mid + half * x) for x in xs]
+        lons = _unwrap([lon for (lon, lat) in samples])
+        lats = [lat for (lon, lat) in samples]
+        lonC = _fit(list(reversed(lons)), n)
+        latC = _fit(list(reversed(lats)), n)
+        segment = [start, end, lonC, latC,
+                   _derivative(lonC, 1.0 / half),
+                   _derivative(latC, 1.0 / half)]
+
+        # Verify between the nodes and on a regular grid
+        checks = [(xs[k] + xs[k + 1]) / 2.0 for k in range(n - 1)]
+        checks += [-1.0 + 2.0 * k / CHECKS for k in range(CHECKS + 1)]
+        for x in checks:
+            lon, lat = swe.sweDefaultLonLat(ID, mid + half * x)
+            fitLon = angle.norm(_eval(lonC, x))
+            fitLat = _eval(latC, x)
+            if (abs(angle.closestdistance(lon, fitLon)) > self.maxError or
+                    abs(lat - fitLat) > self.maxError):
+                break
+        else:
+            return [segment]
+
+        # Split in halves
+        if half < MIN_WINDOW:
+            raise ValueError('Cannot interpolate %s at JD %s within '
+                             'the maximum error' % (ID, mid))
+        return (self._fitSegment(ID, start, mid) +
+                self._fitSegment(ID, mid, end))
+
+    def _getSegment(self, ID, jd):
+        """ Returns the segment of an object which
+        includes a julian date.
+
+        """
+        window = self.windows[ID]
+        key = math.floor((jd - EPOCH) / window)
+        try:
+            segments = self.segments[ID][key]
+        except KeyError:
+            start = EPOCH + key * window
+            segments = self._fitSegment(ID, start, start + window)
+            self.segments[ID][key] = segments
+        for segment in segments:
+            if jd < segment[1]:
+                return segment
+        return segments[-1]
+
+    def clear(self):
+        """ Removes all fitted segments. """
+        self.segments = dict((ID, {}) for ID in self.windows)
+
+    def fill(self, ID, start, end):
+        """ Fits all segments of an object between
+        two julian dates.
+
+        """
+        window = self.windows[ID]
+        jd = start
+        while jd < end + window:
+            self._getSegment(ID, min(jd, end))
+            jd += window
+
+    # === Evaluation === #
+
+    def _evalSegment(self, segment, jd):
+        """ Evaluates all positions of a segment. """
+        start, end = segment[0], segment[1]
+        x = (2.0 * jd - start - end) / (end - start)
+        return (
+            angle.norm(_eval(segment[2], x)),
+            _eval(segment[3], x),
+            _eval(segment[4], x),
+            _eval(segment[5], x)
+        )
+
+    def get(self, ID, jd):
+        """ Returns (lon, lat, lonspeed, latspeed) of an
+        object at a julian date.
+
+        """
+        segment = self._getSegment(ID, jd)
+        return self._evalSegment(segment, jd)
+
+    def getLon(self, ID, jd):
+        """ Returns the longitude of an object at a
+        julian date.
+
+        """
+        segment = self._getSegment(ID, jd)
+        start, end = segment[0], segment[1]
+        x = (2.0 * jd - start - end) / (end - start)
+        return angle.norm(_eval(segment[2], x))
+
+    # === Persistence === #
+
+    def save(self, path):
+        """ Saves this cache to a file. """
+        data = {
+            'version': VERSION,
+            'maxError': self.maxError,
+            'windows': self.windows,
+            'degree': self.degree,
+            'segments': dict(
+                (ID, sum(segments.values(), []))
+                for (ID, segments) in self.segments.items()
+            )
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path):
+        """ Loads a cache from a file. """
+        with open(path) as f:
+            data = json.load(f)
+        if data['version'] != VERSION:
+            raise ValueError('Unsupported cache version')
+        cache = cls(data['maxError'], data['windows'], data['degree'])
+        for ID, segments in data['segments'].items():
+            window = cache.windows[ID]
+            for segment in segments:
+                key = math.floor((segment[0] - EPOCH) / window)
+                cache.segments[ID].setdefault(key, []).append(segment)
+        return cache
@@ -0,0 +1,82 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+    Author: João Ventura (flatangleweb@gmail.com)
+
+
+    This module implements ephemeris contexts, which
+    configure the path of the swe files, the flags used
+    for computing objects and the default house system.
+
+    A context is activated for the current thread with
+    the 'with' statement, so that concurrent threads can
+    use different contexts. Charts keep the context in
+    which they were created.
+
+"""
+
+import threading
+import swisseph
+
+from flatlib import const
+
+# Default flags for computing objects
+FLAGS = swisseph.FLG_SWIEPH | swisseph.FLG_SPEED
+
+# Stacks of active contexts of each thread
+_local = threading.local()
+
+
+# ---------------------------- #
+#   EphemerisContext Class     #
+# ---------------------------- #
+
+class EphemerisContext:
+    """ This class represents an ephemeris configuration.
+
+    A path of None uses the default path, which is set
+    with swe.setPath(). Contexts should not be changed
+    after they are created.
+
+    """
+
+    def __init__(self, path=None, flags=FLAGS,
+                 hsys=const.HOUSES_DEFAULT):
+        self.path = path
+        self.flags = flags
+        self.hsys = hsys
+
+    def isDefault(self):
+        """ Returns if this context computes objects with
+        the default path and flags.
+
+        """
+        return self.path is None and self.flags == FLAGS
+
+    def __enter__(self):
+        _stack().append(self)
+        return self
+
+    def __exit__(self, *args):
+        _stack().pop()
+
+
+# The default context
+DEFAULT = EphemerisContext()
+
+
+def _stack():
+    """ Returns the stack of contexts of the current
+    thread.
+
+    """
+    try:
+        return _local.stack
+    except AttributeError:
+        _local.stack = []
+        return _local.stack
+
+
+def current():
+    """ Returns the active context of the current thread. """
+    stack = _stack()
+    return stack[-1] if stack else DEFAULT
@@ -14,15 +14,17 @@
 
 from . import swe
 from . import tools
+from . import fixedstars
 from flatlib import angle
 from flatlib import const
 
 
 # === Objects === #
 
-def getObject(ID, jd, lat, lon):
+def getObject(ID, jd, lat, lon, hsys=const.HOUSES_DEFAULT):
     """ Returns an object for a specific date and 
-    location.
+    location. The house system is used by the Pars
+    Fortuna.
     
     """
     if ID == const.SOUTH_NODE:
@@ -32,7 +34,7 @@ def getObject(ID, jd, lat, lon):
             'lon': angle.norm(obj['lon'] + 180)
         })
     elif ID == const.PARS_FORTUNA:
-        pflon = tools.pfLon(jd, lat, lon)
+        pflon = tools.pfLon(jd, lat, lon, hsys)
         obj = {
             'id': ID,
             'lon': pflon,
@@ -51,6 +53,67 @@ def getObject(ID, jd, lat, lon):
     return obj
 
 
+def getObjectList(IDs, jd, lat, lon, hsys=const.HOUSES_DEFAULT):
+    """ Returns a list of objects for a specific date
+    and location. 
+    
+    Objects which exist in the Swiss Ephemeris are 
+    computed in a single batch and the South Node is 
+    derived from the North Node.
+    
+    """
+    sweIDs = [ID for ID in IDs if ID in swe.SWE_OBJECTS]
+    if const.SOUTH_NODE in IDs and const.NORTH_NODE not in sweIDs:
+        sweIDs.append(const.NORTH_NODE)
+    values = swe.sweObjects(sweIDs, jd)
+    index = dict((ID, 4 * i) for (i, ID) in enumerate(sweIDs))
+
+    res = []
+    for ID in IDs:
+        if ID in index:
+            i = index[ID]
+            objLon = values[i]
+        elif ID == const.SOUTH_NODE:
+            i = index[const.NORTH_NODE]
+            objLon = angle.norm(values[i] + 180)
+        else:
+            res.append(getObject(ID, jd, lat, lon, hsys))
+            continue
+        obj = {
+            'id': ID,
+            'lon': objLon,
+            'lat': values[i + 1],
+            'lonspeed': values[i + 2],
+            'latspeed': values[i + 3]
+        }
+        _signInfo(obj)
+        res.append(obj)
+    return res
+
+
+def getObjectSeries(IDs, jds):
+    """ Returns the positions of objects over a sequence 
+    of julian dates as contiguous arrays with one row per 
+    date and one column per object. No objects are built.
+    
+    Besides the Swiss Ephemeris objects, it supports the
+    South Node.
+    
+    """
+    sweIDs = [const.NORTH_NODE if ID == const.SOUTH_NODE else ID
+              for ID in IDs]
+    series = swe.sweObjectsSeries(sweIDs, jds)
+
+    # Opposes the North Node to get the South Node
+    south = [i for (i, ID) in enumerate(IDs) if ID == const.SOUTH_NODE]
+    if south:
+        lons = series['lon']
+        for row in range(0, len(lons), len(IDs)):
+            for i in south:
+                lons[row + i] = angle.norm(lons[row + i] + 180)
+    return series
+
+
 # === Houses === #
 
 def getHouses(jd, lat, lon, hsys):
@@ -72,6 +135,30 @@ def getFixedStar(ID, jd):
     return star
 
 
+def getFixedStarList(IDs, jd):
+    """ Returns a list of fixed stars. All stars are 
+    computed at once from the in-memory star catalog,
+    or by the Swiss Ephemeris outside its date range.
+    
+    """
+    catalog = fixedstars.getCatalog()
+    if not catalog.covers(jd):
+        return [getFixedStar(ID, jd) for ID in IDs]
+    indexes = [catalog.find(ID) for ID in IDs]
+    lons, lats = catalog.positions(jd, indexes)
+    res = []
+    for (k, ID) in enumerate(IDs):
+        star = {
+            'id': ID,
+            'mag': catalog.mag[indexes[k]],
+            'lon': lons[k],
+            'lat': lats[k]
+        }
+        _signInfo(star)
+        res.append(star)
+    return res
+
+
 # === Solar returns === #
 
 def nextSolarReturn(jd, lon):
@@ -109,10 +196,15 @@ def lastSunset(jd, lat, lon):
 # === Stations === #
 
 def nextStation(ID, jd):
-    """ Returns the aproximate jd of the next station. """
+    """ Returns the jd of the next station. """
     return tools.nextStationJD(ID, jd)
 
 
+def stations(ID, start, end):
+    """ Returns the jds of the stations between two jds. """
+    return tools.stationsJD(ID, start, end)
+
+
 # === Other functions === #
 
 def _signInfo(obj):
@@ -16,6 +16,7 @@
 from . import eph
 from . import swe
 
+from flatlib import const
 from flatlib.datetime import Datetime
 from flatlib.object import (GenericObject, Object,
                             House, FixedStar)
@@ -25,15 +26,16 @@ from flatlib.lists import (GenericList, ObjectList,
 
 # === Objects === #
 
-def getObject(ID, date, pos):
+def getObject(ID, date, pos, hsys=const.HOUSES_DEFAULT):
     """ Returns an ephemeris object. """
-    obj = eph.getObject(ID, date.jd, pos.lat, pos.lon)
+    obj = eph.getObject(ID, date.jd, pos.lat, pos.lon, hsys)
     return Object.fromDict(obj)
 
 
-def getObjectList(IDs, date, pos):
+def getObjectList(IDs, date, pos, hsys=const.HOUSES_DEFAULT):
     """ Returns a list of objects. """
-    objList = [getObject(ID, date, pos) for ID in IDs]
+    objs = eph.getObjectList(IDs, date.jd, pos.lat, pos.lon, hsys)
+    objList = [Object.fromDict(obj) for obj in objs]
     return ObjectList(objList)
 
 
@@ -72,7 +74,8 @@ def getFixedStar(ID, date):
 
 def getFixedStarList(IDs, date):
     """ Returns a list of fixed stars. """
-    starList = [getFixedStar(ID, date) for ID in IDs]
+    stars = eph.getFixedStarList(IDs, date.jd)
+    starList = [FixedStar.fromDict(star) for star in stars]
     return FixedStarList(starList)
 
 
@@ -119,11 +122,20 @@ def lastSunset(date, pos):
 # === Station === #
 
 def nextStation(ID, date):
-    """ Returns the aproximate date of the next station. """
+    """ Returns the date of the next station. """
     jd = eph.nextStation(ID, date.jd)
     return Datetime.fromJD(jd, date.utcoffset)
 
 
+def getStations(ID, start, end):
+    """ Returns the dates of the stations of a planet
+    between two dates.
+    
+    """
+    jds = eph.stations(ID, start.jd, end.jd)
+    return [Datetime.fromJD(jd, start.utcoffset) for jd in jds]
+
+
 # === Eclipses === #
 
 def prevSolarEclipse(date):
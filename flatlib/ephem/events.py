@@ -0,0 +1,231 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+    Author: João Ventura (flatangleweb@gmail.com)
+
+
+    This module implements a scanner of astronomical
+    events over a range of julian dates.
+
+    Angles which are functions of object longitudes are
+    sampled in steps adapted to each object. Steps are
+    split at the stations of the angles, so that angles
+    are monotonic between samples and all crossings of
+    target angles are found. Crossings are refined with
+    Newton iteration.
+
+    Events are dicts with the 'type' and 'jd' of the
+    event and are yielded in time order by generators,
+    so that long ranges are never kept in memory.
+
+"""
+
+import heapq
+import itertools
+import math
+
+from . import swe
+from . import tools
+from flatlib import angle
+from flatlib import const
+from flatlib import props
+
+# Event types
+INGRESS = 'Ingress'
+STATION = 'Station'
+ASPECT = 'Aspect'
+LUNATION = 'Lunation'
+
+LIST_EVENTS = [INGRESS, STATION, ASPECT, LUNATION]
+
+# Lunation phases
+NEW_MOON = 'New Moon'
+FULL_MOON = 'Full Moon'
+
+# Sampling steps of objects without stations (days)
+STEPS = {
+    const.SUN: 30,
+    const.MOON: 2
+}
+
+
+# === Sampling === #
+
+def objectStep(ID):
+    """ Returns the sampling step of an object. """
+    try:
+        return STEPS[ID]
+    except KeyError:
+        return tools.stationStep(ID)
+
+
+def _lonFunc(ID):
+    """ Returns a function of the longitude and speed
+    of an object.
+
+    """
+    return lambda jd: swe.sweObjectLonSpeed(ID, jd)
+
+
+def _diffFunc(ID1, ID2):
+    """ Returns a function of the difference of the
+    longitudes and speeds of two objects.
+
+    """
+    def func(jd):
+        lon1, speed1 = swe.sweObjectLonSpeed(ID1, jd)
+        lon2, speed2 = swe.sweObjectLonSpeed(ID2, jd)
+        return (angle.norm(lon1 - lon2), speed1 - speed2)
+    return func
+
+
+def _samples(func, start, end, step):
+    """ Yields (jd, angle, speed) between two julian
+    dates, including the stations of the angle.
+
+    """
+    speedFunc = lambda jd: func(jd)[1]
+    jd = start
+    lon, speed = func(jd)
+    yield (jd, lon, speed)
+    while jd < end:
+        nextjd = min(jd + step, end)
+        nextlon, nextspeed = func(nextjd)
+        if speed * nextspeed < 0:
+            stationJD = tools.secantJD(speedFunc, jd, nextjd,
+                                       speed, nextspeed)
+            yield (stationJD, func(stationJD)[0], 0.0)
+        yield (nextjd, nextlon, nextspeed)
+        jd, lon, speed = nextjd, nextlon, nextspeed
+
+
+def _crossed(lon1, lon2, target):
+    """ Returns the unwrapped target angle crossed
+    between two angles, or None.
+
+    """
+    dist = angle.closestdistance(lon1, lon2)
+    lo, hi = sorted([lon1, lon1 + dist])
+    value = target + 360 * math.ceil((lo - target) / 360)
+    if dist > 0 and lo < value <= hi:
+        return value
+    if dist < 0 and lo <= value < hi:
+        return value
+    return None
+
+
+def crossings(func, start, end, targets, step):
+    """ Yields (jd, target, dist) when an angle crosses
+    the target angles between two julian dates, where
+    'dist' is the signed motion of the angle in the
+    sampling step.
+
+    The function 'func' returns the angle and its speed
+    at a julian date. The step must be smaller than the
+    time between stations of the angle and the angle
+    must move less than 180 degrees in a step.
+
+    """
+    samples = _samples(func, start, end, step)
+    jd1, lon1, speed1 = next(samples)
+    for (jd2, lon2, speed2) in samples:
+        found = []
+        for target in targets:
+            value = _crossed(lon1, lon2, target)
+            if value is None:
+                continue
+
+            # Refine from the linear interpolation
+            dist = angle.closestdistance(lon1, lon2)
+            jd = jd1 + (jd2 - jd1) * (value - lon1) / dist
+
+            def distFunc(jd, target=target):
+                lon, speed = func(jd)
+                return (angle.closestdistance(target, lon), speed)
+
+            if dist > 0:
+                jd = tools.newtonJD(distFunc, jd, neg=jd1, pos=jd2)
+            else:
+                jd = tools.newtonJD(distFunc, jd, neg=jd2, pos=jd1)
+            found.append((jd, target, dist))
+        yield from sorted(found)
+        jd1, lon1, speed1 = jd2, lon2, speed2
+
+
+# === Event sources === #
+
+def ingresses(ID, start, end):
+    """ Yields the sign ingresses of an object. """
+    targets = [i * 30.0 for i in range(12)]
+    for (jd, target, dist) in crossings(_lonFunc(ID), start, end,
+                                        targets, objectStep(ID)):
+        index = int(target // 30) if dist > 0 else int(target // 30) - 1
+        yield {
+            'type': INGRESS,
+            'jd': jd,
+            'id': ID,
+            'sign': const.LIST_SIGNS[index % 12]
+        }
+
+
+def stations(ID, start, end):
+    """ Yields the stations of a planet. """
+    if ID not in props.object.synodicPeriod:
+        return
+    for jd in tools.iterStationsJD(ID, start, end):
+        speed = swe.sweObjectLonSpeed(ID, jd + tools.STATION_ERROR)[1]
+        yield {
+            'type': STATION,
+            'jd': jd,
+            'id': ID,
+            'direction': const.RETROGRADE if speed < 0 else const.DIRECT
+        }
+
+
+def aspects(ID1, ID2, start, end, aspList=const.MAJOR_ASPECTS):
+    """ Yields the exact aspects between two objects. """
+    targets = sorted(set(aspList) | set(360 - asp for asp in aspList
+                                        if asp not in [0, 180]))
+    step = min(objectStep(ID1), objectStep(ID2))
+    for (jd, target, dist) in crossings(_diffFunc(ID1, ID2), start,
+                                        end, targets, step):
+        yield {
+            'type': ASPECT,
+            'jd': jd,
+            'active': ID1,
+            'passive': ID2,
+            'aspect': min(target, 360 - target)
+        }
+
+
+def lunations(start, end):
+    """ Yields the new and full moons. """
+    for (jd, target, dist) in crossings(_diffFunc(const.MOON, const.SUN),
+                                        start, end, [0, 180],
+                                        objectStep(const.MOON)):
+        yield {
+            'type': LUNATION,
+            'jd': jd,
+            'phase': NEW_MOON if target == 0 else FULL_MOON
+        }
+
+
+# === Public functions === #
+
+def getEvents(start, end, IDs=const.LIST_SEVEN_PLANETS,
+              aspList=const.MAJOR_ASPECTS, types=LIST_EVENTS):
+    """ Yields the events of a list of objects between
+    two julian dates in time order.
+
+    """
+    sources = []
+    for ID in IDs:
+        if INGRESS in types:
+            sources.append(ingresses(ID, start, end))
+        if STATION in types:
+            sources.append(stations(ID, start, end))
+    if ASPECT in types:
+        for (ID1, ID2) in itertools.combinations(IDs, 2):
+            sources.append(aspects(ID1, ID2, start, end, aspList))
+    if LUNATION in types:
+        sources.append(lunations(start, end))
+    return heapq.merge(*sources, key=lambda event: event['jd'])
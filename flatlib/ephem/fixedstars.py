@@ -0,0 +1,290 @@
+"""
+    This file is part of flatlib - (C) FlatAngle
+    Author: João Ventura (flatangleweb@gmail.com)
+
+
+    This module implements an in-memory catalog of
+    fixed stars.
+
+    The catalog file of the Swiss Ephemeris is parsed
+    only once into arrays of names, J2000 coordinates,
+    space motions and magnitudes. Positions for a date
+    are computed for a list of stars at once, by applying
+    the space motions, IAU 2006 precession, nutation and
+    annual aberration.
+
+    Positions agree with the Swiss Ephemeris to about one
+    arc-second between the years 800 and 3000. Outside
+    this range the precession model diverges from the
+    long-term model of the Swiss Ephemeris, which should
+    be used instead.
+
+"""
+
+import os
+import math
+from array import array
+
+from . import swe
+from flatlib import const
+
+# Default catalog file
+CATALOG_FILE = 'sefstars.txt'
+
+# Constant of aberration (degrees)
+ABERRATION = 20.49552 / 3600
+
+# Eccentricity of the earth's orbit
+ECCENTRICITY = 0.016708634
+
+# Range of julian dates of the catalog positions
+# (years 800 to 3000)
+MIN_JD = 2013253.5
+MAX_JD = 2816787.5
+
+# Kilometers per second in astronomical units per year
+KMS = 365.25 * 86400 / 149597870.7
+
+
+# === Private functions === #
+
+def _key(name):
+    """ Returns the lookup key of a star name. """
+    return name.replace(' ', '').lower()
+
+
+def _resolve(ID, entries):
+    """ Returns the index of the entry used by the Swiss
+    Ephemeris for a repeated star name, given a list of 
+    (name, nomname, index) entries.
+    
+    """
+    name, nomname = swe.sweFixedStarName(ID)
+    for (entryName, entryNomname, i) in entries:
+        if _key(entryName) == _key(name) and entryNomname == nomname:
+            return i
+    return entries[0][2]
+
+
+def _precession(t):
+    """ Returns the IAU 2006 precession angles zeta, z
+    and theta (radians) for 't' julian centuries since
+    J2000.
+
+    """
+    zeta = (2.650545 + t * (2306.083227 + t * (0.2988499 +
+                                              t * 0.01801828)))
+    z = (-2.650545 + t * (2306.077181 + t * (1.0927348 +
+                                            t * 0.01826837)))
+    theta = t * (2004.191903 - t * (0.4294934 + t * 0.04182264))
+    return (math.radians(zeta / 3600),
+            math.radians(z / 3600),
+            math.radians(theta / 3600))
+
+
+def _matrix(jd):
+    """ Returns the rotation matrix from J2000 equatorial
+    coordinates to mean ecliptic coordinates of date,
+    together with the nutation in longitude, the sun 
+    longitude and the longitude of the perihelion of the
+    earth's orbit (degrees).
+
+    """
+    t = (jd + swe.sweDeltaT(jd) - 2451545.0) / 36525
+    zeta, z, theta = _precession(t)
+    obliquity, nutation = swe.sweNutation(jd)
+    eps = math.radians(obliquity)
+
+    # Precession matrix (J2000 to mean equator of date)
+    cz, sz = math.cos(zeta), math.sin(zeta)
+    cZ, sZ = math.cos(z), math.sin(z)
+    ct, st = math.cos(theta), math.sin(theta)
+    P = [
+        [cz * ct * cZ - sz * sZ, -sz * ct * cZ - cz * sZ, -st * cZ],
+        [cz * ct * sZ + sz * cZ, -sz * ct * sZ + cz * cZ, -st * sZ],
+        [cz * st, -sz * st, ct]
+    ]
+
+    # Rotation to the mean ecliptic of date
+    ce, se = math.cos(eps), math.sin(eps)
+    M = [
+        P[0],
+        [ce * P[1][j] + se * P[2][j] for j in range(3)],
+        [-se * P[1][j] + ce * P[2][j] for j in range(3)]
+    ]
+
+    sun, lat = swe.sweDefaultLonLat(const.SUN, jd)
+    perihelion = 102.93735 + 1.71946 * t
+    return (M, nutation, sun, perihelion)
+
+
+# ---------------------------- #
+#   FixedStarCatalog Class     #
+# ---------------------------- #
+
+class FixedStarCatalog:
+    """ This class represents a catalog of fixed stars
+    loaded into memory.
+
+    Stars are indexed by their traditional names,
+    ignoring case and blanks, and by nomenclature 
+    names preceded by a comma (such as ',alTau'). 
+    Repeated names are resolved to the same entry used
+    by the Swiss Ephemeris.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.names = []
+        self.index = {}
+        self.ra = array('d')
+        self.decl = array('d')
+        self.pmra = array('d')
+        self.pmdecl = array('d')
+        self.radvel = array('d')
+        self.mag = array('d')
+        self._load(path)
+
+    def _load(self, path):
+        """ Parses a catalog file. """
+        entries = {}
+        with open(path, encoding='latin-1') as f:
+            for line in f:
+                if line.startswith('#') or not line.strip():
+                    continue
+                fields = [field.strip() for field in line.split(',')]
+
+                # Only J2000 and ICRS coordinates
+                if fields[2] not in ['2000', 'ICRS']:
+                    continue
+                ra = (float(fields[3]) + float(fields[4]) / 60 +
+                      float(fields[5]) / 3600) * 15
+                sign = -1 if fields[6].startswith('-') else 1
+                decl = sign * (abs(float(fields[6])) +
+                               float(fields[7]) / 60 +
+                               float(fields[8]) / 3600)
+
+                # Proper motions from 0.001"/year to rad/year
+                pmra = math.radians(float(fields[9] or 0) / 3600000)
+                pmdecl = math.radians(float(fields[10] or 0) / 3600000)
+
+                # Radial velocity from km/s to parallaxes per year
+                parallax = math.radians(float(fields[12] or 0) / 3600000)
+                radvel = float(fields[11] or 0) * KMS * parallax
+
+                # Negative parallaxes reverse the directions of
+                # the star and its proper motion, as in the Swiss
+                # Ephemeris
+                if parallax < 0:
+                    ra, decl = ra + 180, -decl
+                    pmra, pmdecl = -pmra, -pmdecl
+
+                i = len(self.names)
+                self.names.append(fields[0] or ',' + fields[1])
+                entry = (fields[0], fields[1], i)
+                for ID in [fields[0], ',' + fields[1]]:
+                    if ID:
+                        entries.setdefault(_key(ID), (ID, []))[1].append(entry)
+                self.ra.append(math.radians(ra))
+                self.decl.append(math.radians(decl))
+                self.pmra.append(pmra)
+                self.pmdecl.append(pmdecl)
+                self.radvel.append(radvel)
+                self.mag.append(float(fields[13]))
+
+        # Index the names and resolve repeated names
+        for (key, (ID, keyEntries)) in entries.items():
+            if len(keyEntries) == 1:
+                self.index[key] = keyEntries[0][2]
+            else:
+                self.index[key] = _resolve(ID, keyEntries)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, ID):
+        return _key(ID) in self.index
+
+    def find(self, ID):
+        """ Returns the index of a star in the catalog. """
+        return self.index[_key(ID)]
+
+    def magnitude(self, ID):
+        """ Returns the magnitude of a star. """
+        return self.mag[self.find(ID)]
+
+    def covers(self, jd):
+        """ Returns if the catalog positions are valid
+        for a julian date.
+
+        """
+        return MIN_JD <= jd <= MAX_JD
+
+    def positions(self, jd, indexes=None):
+        """ Returns the ecliptical longitudes and latitudes
+        of stars for a julian date, as two arrays.
+
+        It computes all stars in the catalog by default,
+        or only the stars given by a list of indexes.
+
+        """
+        if indexes is None:
+            indexes = range(len(self.names))
+        M, nutation, sunlon, perihelion = _matrix(jd)
+        years = (jd - 2451545.0) / 365.25
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = M
+
+        lons = array('d', bytes(8 * len(indexes)))
+        lats = array('d', bytes(8 * len(indexes)))
+        for (k, i) in enumerate(indexes):
+            # Position plus space motion, in units of the
+            # distance of the star at J2000
+            ra, decl = self.ra[i], self.decl[i]
+            cra, sra = math.cos(ra), math.sin(ra)
+            cdecl, sdecl = math.cos(decl), math.sin(decl)
+            pmra = self.pmra[i] * years
+            pmdecl = self.pmdecl[i] * years
+            radial = 1 + self.radvel[i] * years
+            x = radial * cdecl * cra - pmra * sra - pmdecl * sdecl * cra
+            y = radial * cdecl * sra + pmra * cra - pmdecl * sdecl * sra
+            z = radial * sdecl + pmdecl * cdecl
+
+            # Ecliptical coordinates of date
+            ex = m00 * x + m01 * y + m02 * z
+            ey = m10 * x + m11 * y + m12 * z
+            ez = m20 * x + m21 * y + m22 * z
+            lon = math.degrees(math.atan2(ey, ex))
+            lat = math.degrees(math.atan2(ez, math.hypot(ex, ey)))
+
+            # Annual aberration
+            dist = math.radians(sunlon - lon)
+            pdist = math.radians(perihelion - lon)
+            rlat = math.radians(lat)
+            lon -= ABERRATION * (math.cos(dist) - ECCENTRICITY *
+                                 math.cos(pdist)) / math.cos(rlat)
+            lat -= ABERRATION * (math.sin(dist) - ECCENTRICITY *
+                                 math.sin(pdist)) * math.sin(rlat)
+
+            lons[k] = (lon + nutation) % 360
+            lats[k] = lat
+        return (lons, lats)
+
+
+# === Default catalogs === #
+
+# Catalogs indexed by file path
+_CATALOGS = {}
+
+
+def getCatalog():
+    """ Returns the catalog of the current ephemeris
+    path, which is loaded only once.
+
+    """
+    path = os.path.join(swe.getPath(), CATALOG_FILE)
+    try:
+        return _CATALOGS[path]
+    except KeyError:
+        catalog = FixedStarCatalog(path)
+        return _CATALOGS.setdefault(path, catalog)
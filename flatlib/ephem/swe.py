@@ -12,8 +12,12 @@
 """
 
 import swisseph
+import threading
+from array import array
+from functools import lru_cache
 from flatlib import angle
 from flatlib import const
+from . import context
 
 # Map objects
 SWE_OBJECTS = {
@@ -50,35 +54,218 @@ SWE_HOUSESYS = {
 }
 
 
+# Default path of the swe files
+_PATH = ''
+
+# The Swiss Ephemeris keeps its state, including the
+# path, for each thread. This stores the path set in
+# the Swiss Ephemeris for each thread.
+_local = threading.local()
+
+# Optional interpolating cache (see chebyshev.py)
+_CACHE = None
+
+# Maximum number of entries of the LRU caches
+CACHE_SIZE = 4096
+
+
+# === LRU caches === #
+
+# Objects and houses computed by the Swiss Ephemeris
+# are kept in bounded LRU caches, so that repeated 
+# lookups for the same moment are free. Objects are
+# cached by path and flags.
+
+def _sweCalc(jd, sweObj, path, flags):
+    _setLibPath(path)
+    return swisseph.calc_ut(jd, sweObj, flags)
+
+
+def _sweHouses(jd, lat, lon, hsys):
+    return swisseph.houses(jd, lat, lon, hsys)
+
+
+_calcUT = lru_cache(CACHE_SIZE)(_sweCalc)
+_houses = lru_cache(CACHE_SIZE)(_sweHouses)
+
+
+def setCacheSize(size):
+    """ Sets the maximum size of the LRU caches. """
+    global _calcUT, _houses
+    _calcUT = lru_cache(size)(_sweCalc)
+    _houses = lru_cache(size)(_sweHouses)
+
+
+def clearCache():
+    """ Clears the LRU caches. """
+    _calcUT.cache_clear()
+    _houses.cache_clear()
+
+
+def cacheInfo():
+    """ Returns the hits, misses and sizes of the 
+    objects and houses LRU caches.
+    
+    """
+    res = {}
+    for (name, cache) in [('objects', _calcUT), ('houses', _houses)]:
+        info = cache.cache_info()
+        res[name] = {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'maxsize': info.maxsize
+        }
+    return res
+
+
 # ==== Internal functions ==== #
 
+def _setLibPath(path):
+    """ Sets the path of the Swiss Ephemeris for the
+    current thread if changed.
+    
+    """
+    if getattr(_local, 'path', None) != path:
+        swisseph.set_ephe_path(path)
+        _local.path = path
+
+
+def _sweCall(func, *args, **kwargs):
+    """ Calls a swisseph function with the path of 
+    the current context.
+    
+    """
+    _setLibPath(getPath())
+    return func(*args, **kwargs)
+
+
 def setPath(path):
-    """ Sets the path for the swe files. """
-    swisseph.set_ephe_path(path)
+    """ Sets the default path for the swe files and
+    clears the caches.
+    
+    """
+    global _PATH
+    _PATH = path
+    _setLibPath(path)
+    clearCache()
+    if _CACHE is not None:
+        _CACHE.clear()
+
+
+def getPath():
+    """ Returns the path for the swe files of the 
+    current context.
+    
+    """
+    return context.current().path or _PATH
+
+
+def setCache(cache):
+    """ Sets an interpolating cache for the object
+    positions. Use None to disable it.
+    
+    """
+    global _CACHE
+    _CACHE = cache
+
+
+def _calc(obj, jd):
+    """ Returns the lon, lat, lonspeed and latspeed of 
+    an object, using the interpolating cache if set.
+    
+    """
+    ctx = context.current()
+    if _CACHE is not None and obj in _CACHE and ctx.isDefault():
+        return _CACHE.get(obj, jd)
+    sweList, flg = _calcUT(jd, SWE_OBJECTS[obj], getPath(), ctx.flags)
+    return (sweList[0], sweList[1], sweList[3], sweList[4])
 
 
 # === Object functions === #
 
+def sweDefaultLonLat(obj, jd):
+    """ Returns the lon and lat of an object using the
+    default path and flags, ignoring the current context
+    and the caches.
+    
+    """
+    sweList, flg = _sweCalc(jd, SWE_OBJECTS[obj], _PATH, context.FLAGS)
+    return (sweList[0], sweList[1])
+
+
 def sweObject(obj, jd):
     """ Returns an object from the Ephemeris. """
-    sweObj = SWE_OBJECTS[obj]
-    sweList, flg = swisseph.calc_ut(jd, sweObj)
+    lon, lat, lonspeed, latspeed = _calc(obj, jd)
     return {
         'id': obj,
-        'lon': sweList[0],
-        'lat': sweList[1],
-        'lonspeed': sweList[3],
-        'latspeed': sweList[4]
+        'lon': lon,
+        'lat': lat,
+        'lonspeed': lonspeed,
+        'latspeed': latspeed
+    }
+
+
+def sweObjects(objs, jd):
+    """ Returns the positions of a list of objects in a
+    single pass. The result is a flat list with the lon,
+    lat, lonspeed and latspeed of each object, in the
+    same order of 'objs'.
+    
+    """
+    res = [0.0] * (4 * len(objs))
+    for (i, obj) in enumerate(objs):
+        res[4 * i: 4 * i + 4] = _calc(obj, jd)
+    return res
+
+
+def sweObjectsSeries(objs, jds):
+    """ Returns the positions of a list of objects over
+    a sequence of julian dates. 
+    
+    The result is a dict with contiguous 'lon', 'lat', 
+    'lonspeed' and 'latspeed' arrays of doubles, each with 
+    len(jds) rows by len(objs) columns in row-major order.
+    
+    """
+    size = len(jds) * len(objs)
+    lons = array('d', bytes(8 * size))
+    lats = array('d', bytes(8 * size))
+    lonspeeds = array('d', bytes(8 * size))
+    latspeeds = array('d', bytes(8 * size))
+
+    i = 0
+    for jd in jds:
+        for obj in objs:
+            lons[i], lats[i], lonspeeds[i], latspeeds[i] = _calc(obj, jd)
+            i += 1
+
+    return {
+        'lon': lons,
+        'lat': lats,
+        'lonspeed': lonspeeds,
+        'latspeed': latspeeds
     }
 
 
 def sweObjectLon(obj, jd):
     """ Returns the longitude of an object. """
-    sweObj = SWE_OBJECTS[obj]
-    sweList, flg = swisseph.calc_ut(jd, sweObj)
+    ctx = context.current()
+    if _CACHE is not None and obj in _CACHE and ctx.isDefault():
+        return _CACHE.getLon(obj, jd)
+    sweList, flg = _calcUT(jd, SWE_OBJECTS[obj], getPath(), ctx.flags)
     return sweList[0]
 
 
+def sweObjectLonSpeed(obj, jd):
+    """ Returns the longitude and longitude speed of
+    an object.
+
+    """
+    lon, lat, lonspeed, latspeed = _calc(obj, jd)
+    return (lon, lonspeed)
+
+
 def sweNextTransit(obj, jd, lat, lon, flag):
     """ Returns the julian date of the next transit of
     an object. The flag should be 'RISE' or 'SET'. 
@@ -86,7 +273,8 @@ def sweNextTransit(obj, jd, lat, lon, flag):
     """
     sweObj = SWE_OBJECTS[obj]
     flag = swisseph.CALC_RISE if flag == 'RISE' else swisseph.CALC_SET
-    trans = swisseph.rise_trans(jd, sweObj, lon, lat, 0, 0, 0, flag)
+    trans = _sweCall(swisseph.rise_trans, jd, sweObj, lon, lat,
+                     0, 0, 0, flag)
     return trans[1][0]
 
 
@@ -95,7 +283,7 @@ def sweNextTransit(obj, jd, lat, lon, flag):
 def sweHouses(jd, lat, lon, hsys):
     """ Returns lists of houses and angles. """
     hsys = SWE_HOUSESYS[hsys]
-    hlist, ascmc = swisseph.houses(jd, lat, lon, hsys)
+    hlist, ascmc = _houses(jd, lat, lon, hsys)
     # Add first house to the end of 'hlist' so that we
     # can compute house sizes with an iterator 
     hlist += (hlist[0],)
@@ -118,7 +306,7 @@ def sweHouses(jd, lat, lon, hsys):
 def sweHousesLon(jd, lat, lon, hsys):
     """ Returns lists with house and angle longitudes. """
     hsys = SWE_HOUSESYS[hsys]
-    hlist, ascmc = swisseph.houses(jd, lat, lon, hsys)
+    hlist, ascmc = _houses(jd, lat, lon, hsys)
     angles = [
         ascmc[0],
         ascmc[1],
@@ -128,16 +316,36 @@ def sweHousesLon(jd, lat, lon, hsys):
     return (hlist, angles)
 
 
+# === Time and nutation === #
+
+def sweDeltaT(jd):
+    """ Returns the difference between terrestrial and
+    universal time (days) at a julian date.
+    
+    """
+    return _sweCall(swisseph.deltat, jd)
+
+
+def sweNutation(jd):
+    """ Returns the mean obliquity of the ecliptic and 
+    the nutation in longitude (degrees) at a julian date.
+    
+    """
+    nut, flg = _sweCall(swisseph.calc_ut, jd, swisseph.ECL_NUT)
+    return (nut[1], nut[2])
+
+
 # === Fixed stars === #
 
 # Beware: the swisseph.fixstar_mag function is really 
 # slow because it parses the fixstars.cat file every 
-# time..
+# time.. Use the catalog in fixedstars.py for lists
+# of stars.
 
 def sweFixedStar(star, jd):
     """ Returns a fixed star from the Ephemeris. """
-    sweList, stnam, flg = swisseph.fixstar2_ut(star, jd)
-    mag = swisseph.fixstar2_mag(star)
+    sweList, stnam, flg = _sweCall(swisseph.fixstar2_ut, star, jd)
+    mag = _sweCall(swisseph.fixstar2_mag, star)
     return {
         'id': star,
         'mag': mag,
@@ -146,12 +354,24 @@ def sweFixedStar(star, jd):
     }
 
 
+def sweFixedStarName(star):
+    """ Returns the traditional and nomenclature names
+    of the catalog entry used for a fixed star.
+    
+    """
+    sweList, stnam, flg = _sweCall(swisseph.fixstar2_ut, star,
+                                   2451545.0)
+    name, nomname = stnam.split(',', 1)
+    return (name, nomname)
+
+
 # === Eclipses === #
 
 def solarEclipseGlobal(jd, backward):
     """ Returns the jd details of previous or next global solar eclipse. """
 
-    sweList = swisseph.sol_eclipse_when_glob(jd, backward=backward)
+    sweList = _sweCall(swisseph.sol_eclipse_when_glob, jd,
+                       backward=backward)
     return {
         'maximum': sweList[1][0],
         'begin': sweList[1][2],
@@ -166,7 +386,8 @@ def solarEclipseGlobal(jd, backward):
 def lunarEclipseGlobal(jd, backward):
     """ Returns the jd details of previous or next global lunar eclipse. """
 
-    sweList = swisseph.lun_eclipse_when(jd, backward=backward)
+    sweList = _sweCall(swisseph.lun_eclipse_when, jd,
+                       backward=backward)
     return {
         'maximum': sweList[1][0],
         'partial_begin': sweList[1][2],
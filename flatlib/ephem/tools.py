@@ -11,25 +11,42 @@
 from . import swe
 from flatlib import angle
 from flatlib import const
+from flatlib import props
 from flatlib import utils
 
 # One arc-second error for iterative algorithms
 MAX_ERROR = 0.0003
 
+# Maximum iterations for root finding
+MAX_ITERATIONS = 50
+
+# One second error for stations (days)
+STATION_ERROR = 1 / 86400
+
+# Steps per synodic period when searching stations
+STATION_STEPS = 24
+
+# Default step and range for objects without a 
+# synodic period (days)
+STATION_STEP = 0.5
+STATION_RANGE = 1000
+
 
 # === Object positions === #
 
-def pfLon(jd, lat, lon):
+def pfLon(jd, lat, lon, hsys=const.HOUSES_DEFAULT):
     """ Returns the ecliptic longitude of Pars Fortuna.
     It considers diurnal or nocturnal conditions.
     
+    The house system does not change the ascendant, but
+    using the chart's house system reuses its houses.
+    
     """
     sun = swe.sweObjectLon(const.SUN, jd)
     moon = swe.sweObjectLon(const.MOON, jd)
-    asc = swe.sweHousesLon(jd, lat, lon,
-                           const.HOUSES_DEFAULT)[1][0]
+    asc = swe.sweHousesLon(jd, lat, lon, hsys)[1][0]
 
-    if isDiurnal(jd, lat, lon):
+    if isDiurnal(jd, lat, lon, hsys):
         return angle.norm(asc + moon - sun)
     else:
         return angle.norm(asc + sun - moon)
@@ -37,14 +54,13 @@ def pfLon(jd, lat, lon):
 
 # === Diurnal  === #
 
-def isDiurnal(jd, lat, lon):
+def isDiurnal(jd, lat, lon, hsys=const.HOUSES_DEFAULT):
     """ Returns true if the sun is above the horizon
     of a given date and location. 
     
     """
     sun = swe.sweObject(const.SUN, jd)
-    mc = swe.sweHousesLon(jd, lat, lon,
-                          const.HOUSES_DEFAULT)[1][1]
+    mc = swe.sweHousesLon(jd, lat, lon, hsys)[1][1]
     ra, decl = utils.eqCoords(sun['lon'], sun['lat'])
     mcRA, _ = utils.eqCoords(mc, 0.0)
     return utils.isAboveHorizon(ra, decl, mcRA, lat)
@@ -52,6 +68,56 @@ def isDiurnal(jd, lat, lon):
 
 # === Iterative algorithms === #
 
+def newtonJD(func, jd, neg=None, pos=None):
+    """ Finds the julian date near 'jd' when a signed
+    distance is zero.
+
+    The function 'func' returns the distance (degrees)
+    and its speed (degrees per day) at a julian date. 
+    Newton steps use the speed and fall back to the
+    bisection of the dates around the root when they
+    leave them or when the speed is zero. Dates with
+    negative and positive distances can be given if
+    known. It raises ValueError if the distance does
+    not converge in MAX_ITERATIONS steps.
+
+    """
+    for i in range(MAX_ITERATIONS):
+        dist, speed = func(jd)
+        if abs(dist) <= MAX_ERROR:
+            return jd
+
+        # Dates on each side of the root, ignoring
+        # the jumps of distances at 180 degrees
+        if abs(dist) < 90:
+            if dist < 0:
+                neg = jd
+            else:
+                pos = jd
+
+        nextjd = jd - dist / speed if speed else None
+        if neg is not None and pos is not None:
+            lo, hi = min(neg, pos), max(neg, pos)
+            if nextjd is None or not lo < nextjd < hi:
+                nextjd = (lo + hi) / 2
+        if nextjd is None:
+            raise ValueError('Cannot find root near JD %s' % jd)
+        jd = nextjd
+    raise ValueError('No convergence near JD %s' % jd)
+
+
+def lonCrossingJD(ID, lon, jd):
+    """ Finds the julian date near 'jd' when an 
+    object is at longitude 'lon'.
+    
+    """
+    def func(jd):
+        objLon, speed = swe.sweObjectLonSpeed(ID, jd)
+        return (angle.closestdistance(lon, objLon), speed)
+
+    return newtonJD(func, jd)
+
+
 def syzygyJD(jd):
     """ Finds the latest new or full moon and
     returns the julian date of that event. 
@@ -64,12 +130,16 @@ def syzygyJD(jd):
     # Offset represents the Syzygy type. 
     # Zero is conjunction and 180 is opposition.
     offset = 180 if (dist >= 180) else 0
-    while abs(dist) > MAX_ERROR:
-        jd = jd - dist / 13.1833  # Moon mean daily motion
-        sun = swe.sweObjectLon(const.SUN, jd)
-        moon = swe.sweObjectLon(const.MOON, jd)
+
+    def func(jd):
+        sun, sunspeed = swe.sweObjectLonSpeed(const.SUN, jd)
+        moon, moonspeed = swe.sweObjectLonSpeed(const.MOON, jd)
         dist = angle.closestdistance(sun - offset, moon)
-    return jd
+        return (dist, moonspeed - sunspeed)
+
+    # Step back with the mean synodic motion
+    jd = jd - (dist - offset) / 12.1907
+    return newtonJD(func, jd)
 
 
 def solarReturnJD(jd, lon, forward=True):
@@ -84,24 +154,99 @@ def solarReturnJD(jd, lon, forward=True):
     else:
         dist = -angle.distance(lon, sun)
 
-    while abs(dist) > MAX_ERROR:
-        jd = jd + dist / 0.9833  # Sun mean motion
-        sun = swe.sweObjectLon(const.SUN, jd)
-        dist = angle.closestdistance(sun, lon)
-    return jd
+    # Step with the mean motion of the sun
+    jd = jd + dist / 0.9856
+    return lonCrossingJD(const.SUN, lon, jd)
+
+
+# === Stations === #
 
+def secantJD(func, jd1, jd2, value1, value2, error=STATION_ERROR):
+    """ Finds the julian date between 'jd1' and 'jd2'
+    when 'func' is zero, given its values at both dates
+    with opposite signs. 
+    
+    It uses the false position method with the Illinois
+    modification, until the dates are within 'error' days.
+    It raises ValueError if the dates do not converge in
+    MAX_ITERATIONS steps.
+
+    """
+    side = 0
+    for i in range(MAX_ITERATIONS):
+        jd = (jd1 * value2 - jd2 * value1) / (value2 - value1)
+        value = func(jd)
+        if value == 0:
+            return jd
+        if value * value2 > 0:
+            jd2, value2 = jd, value
+            if side == -1:
+                value1 /= 2
+            side = -1
+        else:
+            jd1, value1 = jd, value
+            if side == 1:
+                value2 /= 2
+            side = 1
+        if abs(jd2 - jd1) < error:
+            return (jd1 * value2 - jd2 * value1) / (value2 - value1)
+    raise ValueError('No convergence between JD %s and %s' % (jd1, jd2))
+
+
+def stationStep(ID):
+    """ Returns the step (in days) for searching the 
+    stations of an object, which is small enough to
+    find both stations of a retrogradation.
+    
+    """
+    try:
+        return props.object.synodicPeriod[ID] / STATION_STEPS
+    except KeyError:
+        return STATION_STEP
+
+
+def _lonspeed(ID):
+    """ Returns a function of the longitude speed of 
+    an object. 
+    
+    """
+    return lambda jd: swe.sweObjectLonSpeed(ID, jd)[1]
+
+
+def iterStationsJD(ID, start, end):
+    """ Yields the julian dates of the stations of an
+    object between two julian dates.
+    
+    """
+    func = _lonspeed(ID)
+    step = stationStep(ID)
+    jd = start
+    speed = func(jd)
+    while jd < end:
+        nextjd = min(jd + step, end)
+        nextspeed = func(nextjd)
+        if nextspeed == 0:
+            yield nextjd
+        elif speed * nextspeed < 0:
+            yield secantJD(func, jd, nextjd, speed, nextspeed)
+        jd, speed = nextjd, nextspeed
 
-# === Other algorithms === #
 
 def nextStationJD(ID, jd):
-    """ Finds the aproximate julian date of the
-    next station of a planet.
+    """ Finds the julian date of the next station 
+    of a planet, or None if there is no station 
+    within a synodic period or the default range.
 
     """
-    speed = swe.sweObject(ID, jd)['lonspeed']
-    for i in range(2000):
-        nextjd = jd + i / 2
-        nextspeed = swe.sweObject(ID, nextjd)['lonspeed']
-        if speed * nextspeed <= 0:
-            return nextjd
+    period = props.object.synodicPeriod.get(ID, STATION_RANGE)
+    for stationJD in iterStationsJD(ID, jd, jd + period):
+        return stationJD
     return None
+
+
+def stationsJD(ID, start, end):
+    """ Returns the julian dates of all stations of 
+    a planet between two julian dates. 
+    
+    """
+    return list(iterStationsJD(ID, start, end))
@@ -11,7 +11,11 @@
 
 """
 
+import bisect
+
+from . import angle
 from . import aspects
+from .object import FixedStar
 
 
 # ---------------- #
@@ -45,7 +49,7 @@ class GenericList:
     def copy(self):
         """ Returns a deep copy of this list. """
         values = [obj.copy() for obj in self]
-        return GenericList(values)
+        return self.__class__(values)
 
     def __iter__(self):
         """ Returns an iterator to this list. """
@@ -64,14 +68,16 @@ class ObjectList(GenericList):
         res = [obj for obj in self if house.hasObject(obj)]
         return ObjectList(res)
 
-    def getObjectsAspecting(self, point, aspList):
+    def getObjectsAspecting(self, point, aspList, matrix=None):
         """ Returns a list of objects aspecting a point 
-        considering a list of possible aspects.
+        considering a list of possible aspects. An
+        aspect matrix may be given to read the aspects.
         
         """
         res = []
         for obj in self:
-            if obj.isPlanet() and aspects.isAspecting(obj, point, aspList):
+            if obj.isPlanet() and aspects.isAspecting(obj, point, aspList,
+                                                      matrix):
                 res.append(obj)
         return ObjectList(res)
 
@@ -81,10 +87,55 @@ class ObjectList(GenericList):
 # ---------------- #
 
 class HouseList(GenericList):
-    """ Implements a list of houses. """
+    """ Implements a list of houses. 
+    
+    Houses are found by longitude with a bisection on 
+    the sorted start longitudes of the houses, which 
+    are their cusps with the traditional offset.
+    
+    """
+
+    def __init__(self, values=[]):
+        super().__init__(values)
+        self._starts = None
+        self._houses = None
+
+    def add(self, house):
+        """ Adds a house to this list. """
+        super().add(house)
+        self._starts = None
+
+    def _buildIndex(self):
+        """ Builds the sorted lists of start longitudes
+        and houses.
+        
+        """
+        starts = [(angle.norm(house.lon + house._OFFSET), house)
+                  for house in self]
+        starts.sort(key=lambda item: item[0])
+        self._starts = [start for (start, house) in starts]
+        self._houses = [house for (start, house) in starts]
+
+    def _findHouse(self, lon):
+        """ Returns the house starting before a longitude. """
+        i = bisect.bisect_right(self._starts, angle.norm(lon))
+        return self._houses[i - 1]
 
     def getHouseByLon(self, lon):
         """ Returns a house given a longitude. """
+        if self._starts is None:
+            self._buildIndex()
+        if self._houses:
+            house = self._findHouse(lon)
+            if house.inHouse(lon):
+                return house
+
+            # Houses may have been relocated
+            self._buildIndex()
+            house = self._findHouse(lon)
+            if house.inHouse(lon):
+                return house
+
         for house in self:
             if house.inHouse(lon):
                 return house
@@ -94,12 +145,104 @@ class HouseList(GenericList):
         """ Returns the house where an object is located. """
         return self.getHouseByLon(obj.lon)
 
+    def getHousesByLon(self, lons):
+        """ Returns a list with the houses of a sequence 
+        of longitudes.
+        
+        """
+        return [self.getHouseByLon(lon) for lon in lons]
+
+    def getObjectsHouses(self, objList):
+        """ Returns a dict with the houses where each
+        object of a list is located, indexed by object ID.
+        
+        """
+        return dict((obj.id, self.getHouseByLon(obj.lon))
+                    for obj in objList)
+
 
 # ----------------- #
 #  Fixed star List  #
 # ----------------- #
 
 class FixedStarList(GenericList):
-    """ Implements a list of fixed stars. """
+    """ Implements a list of fixed stars. 
+    
+    Stars are indexed by longitude when first needed, 
+    so that conjunctions with an object only check the
+    stars close to its longitude. The index is rebuilt
+    when stars are added or relocated with relocate().
+    
+    """
+
+    # Largest orb of a fixed star
+    _MAX_ORB = max(orb for (_, orb) in FixedStar._ORBS)
+
+    def __init__(self, values=[]):
+        super().__init__(values)
+        self._lons = None
+        self._stars = None
+        self._relocations = None
+
+    def add(self, obj):
+        """ Adds a star to this list. """
+        super().add(obj)
+        self._lons = None
+
+    def _buildIndex(self):
+        """ Builds the sorted lists of longitudes and stars. """
+        stars = sorted(self, key=lambda star: star.lon)
+        self._lons = [star.lon for star in stars]
+        self._stars = stars
+        self._relocations = FixedStar._relocations
+
+    def _checkIndex(self):
+        """ Rebuilds the index if stars have been added
+        or relocated since it was built.
+        
+        """
+        if (self._lons is None or
+                self._relocations != FixedStar._relocations or
+                len(self._stars) != len(self.content)):
+            self._buildIndex()
+
+    def _starsBetween(self, lon1, lon2):
+        """ Returns the stars with longitudes between lon1 
+        and lon2, considering the 0/360 wraparound.
+        
+        """
+        lons = self._lons
+        if lon1 < 0:
+            return (self._starsBetween(lon1 + 360, 360) +
+                    self._starsBetween(0, lon2))
+        elif lon2 > 360:
+            return (self._starsBetween(lon1, 360) +
+                    self._starsBetween(0, lon2 - 360))
+        i = bisect.bisect_left(lons, lon1)
+        j = bisect.bisect_right(lons, lon2)
+        return self._stars[i:j]
+
+    def _starsAspecting(self, obj):
+        """ Returns the indexed stars conjunct an object. """
+        lon = obj.lon
+        stars = self._starsBetween(lon - self._MAX_ORB,
+                                   lon + self._MAX_ORB)
+        res = [star for star in stars if star.aspects(obj)]
+        return FixedStarList(res)
+
+    def getStarsAspecting(self, obj):
+        """ Returns a list with the stars which are 
+        conjunct an object within their orbs.
+        
+        """
+        self._checkIndex()
+        return self._starsAspecting(obj)
 
-    pass
+    def getStarsAspectingList(self, objList):
+        """ Returns a dict with the stars conjunct each
+        object of a list, indexed by object ID.
+        
+        """
+        self._checkIndex()
+        return dict((obj.id, self._starsAspecting(obj))
+                    for obj in objList)
@@ -23,9 +23,14 @@ class GenericObject:
     """ This class represents a generic object and
     includes properties which are common to all 
     objects on a chart.
+
+    Objects use slots instead of a dict of properties,
+    which reduces their memory and allocation cost.
     
     """
 
+    __slots__ = ('id', 'type', 'lon', 'lat', 'sign', 'signlon')
+
     def __init__(self):
         self.id = const.NO_PLANET
         self.type = const.OBJ_GENERIC
@@ -38,12 +43,36 @@ class GenericObject:
     def fromDict(cls, _dict):
         """ Builds instance from dictionary of properties. """
         obj = cls()
-        obj.__dict__.update(_dict)
+        for (key, value) in _dict.items():
+            setattr(obj, key, value)
         return obj
 
+    @classmethod
+    def _properties(cls):
+        """ Returns the names of all slots of this class. """
+        try:
+            return cls.__dict__['_PROPERTIES']
+        except KeyError:
+            names = []
+            for klass in reversed(cls.__mro__):
+                names.extend(klass.__dict__.get('__slots__', ()))
+            cls._PROPERTIES = tuple(names)
+            return cls._PROPERTIES
+
+    def toDict(self):
+        """ Returns a dictionary with the properties of 
+        this object.
+        
+        """
+        return dict((key, getattr(self, key))
+                    for key in self._properties())
+
     def copy(self):
         """ Returns a deep copy of this object. """
-        return self.fromDict(self.__dict__)
+        obj = self.__class__.__new__(self.__class__)
+        for key in self._properties():
+            setattr(obj, key, getattr(self, key))
+        return obj
 
     def __str__(self):
         return '<%s %s %s>' % (
@@ -104,6 +133,8 @@ class Object(GenericObject):
     
     """
 
+    __slots__ = ('lonspeed', 'latspeed')
+
     def __init__(self):
         super().__init__()
         self.type = const.OBJ_PLANET
@@ -177,6 +208,8 @@ class Object(GenericObject):
 class House(GenericObject):
     """ This class represents a generic house cusp. """
 
+    __slots__ = ('size',)
+
     # The traditional house offset
     _OFFSET = -5.0
 
@@ -196,7 +229,7 @@ class House(GenericObject):
 
     def num(self):
         """ Returns the number of this house [1..12]. """
-        return int(self.id[5:])
+        return const.HOUSE_INDEX[self.id] + 1
 
     def condition(self):
         """ Returns the condition of this house. 
@@ -213,7 +246,7 @@ class House(GenericObject):
 
     def isAboveHorizon(self):
         """ Returns true if this house is above horizon. """
-        return self.id in props.house.aboveHorizon
+        return props.house.aboveHorizonList[const.HOUSE_INDEX[self.id]]
 
     def inHouse(self, lon):
         """ Returns if a longitude belongs to this house. """
@@ -232,6 +265,8 @@ class House(GenericObject):
 class FixedStar(GenericObject):
     """ This class represents a generic fixed star. """
 
+    __slots__ = ('mag',)
+
     def __init__(self):
         super().__init__()
         self.type = const.OBJ_FIXED_STAR
@@ -258,6 +293,15 @@ class FixedStar(GenericObject):
 
     # === Functions === #
 
+    # Number of relocations of fixed stars, which 
+    # invalidates the indexes of fixed star lists
+    _relocations = 0
+
+    def relocate(self, lon):
+        """ Relocates this star to a new longitude. """
+        super().relocate(lon)
+        FixedStar._relocations += 1
+
     def aspects(self, obj):
         """ Returns true if this star aspects another object.
         Fixed stars only aspect by conjunctions. 
@@ -14,10 +14,25 @@
     
 """
 
+import bisect
+
 from flatlib import angle
 from flatlib import utils
 from flatlib import const
+from flatlib.datetime import Datetime
 from flatlib.dignities import tables
+from flatlib.ephem import swe
+
+# Time keys
+PTOLEMY = 'Ptolemy'
+NAIBOD = 'Naibod'
+TRUE_SOLAR_ARC = 'True Solar Arc'
+
+# Degrees of arc per year of the mean keys
+KEY_RATES = {
+    PTOLEMY: 1.0,
+    NAIBOD: 0.98564733
+}
 
 
 # === Base functions === #
@@ -59,6 +74,47 @@ def arc(pRA, pDecl, sRA, sDecl, mcRA, lat):
     return (pPropDist - sPropDist) * (pArc / 2.0)
 
 
+def promissorArcs(ra, decl, mcRA, lat):
+    """ Returns the distances of a promissor to the
+    MC and IC together with its diurnal and nocturnal
+    semi-arcs, as (mcDist, dSemiArc, icDist, nSemiArc).
+    
+    """
+    dArc, nArc = utils.dnarcs(decl, lat)
+    icRA = angle.norm(mcRA + 180)
+    return (angle.closestdistance(mcRA, ra), dArc / 2.0,
+            angle.closestdistance(icRA, ra), nArc / 2.0)
+
+
+def significatorArcs(ra, decl, mcRA, lat):
+    """ Returns the meridian of a significator (0 for 
+    the MC and 1 for the IC), its distance to that
+    meridian and the distance proportional to its
+    semi-arc.
+    
+    """
+    dArc, nArc = utils.dnarcs(decl, lat)
+    if utils.isAboveHorizon(ra, decl, mcRA, lat):
+        sDist = angle.closestdistance(mcRA, ra)
+        return (0, sDist, sDist / (dArc / 2.0))
+    sDist = angle.closestdistance(angle.norm(mcRA + 180), ra)
+    return (1, sDist, sDist / (nArc / 2.0))
+
+
+def _pairArc(pArcs, sArcs):
+    """ Returns the arc between the promissor and
+    significator arcs, with the same operations of
+    arc().
+    
+    """
+    k, sDist, sPropDist = sArcs
+    pDist = pArcs[2 * k]
+    pSemiArc = pArcs[2 * k + 1]
+    if pDist < sDist:
+        pDist += 360
+    return (pDist / pSemiArc - sPropDist) * pSemiArc
+
+
 def getArc(prom, sig, mc, pos, zerolat):
     """ Returns the arc of direction between a promissor
     and a significator. Arguments are also the MC, the
@@ -93,6 +149,10 @@ class PrimaryDirections:
     S() - Returns the sinister aspect
     N() - Returns the conjunction or opposition aspect
     
+    Points, their semi-arcs and the arcs of each pair
+    are cached, so that changes to the significators,
+    promissors or aspects only compute the new pairs.
+    
     """
 
     # Define common significators
@@ -114,6 +174,10 @@ class PrimaryDirections:
         mc = self.chart.getAngle(const.MC)
         self.mcRA = mc.eqCoords()[0]
         self.terms = self._buildTerms()
+        self._points = {}
+        self._promArcs = {}
+        self._sigArcs = {}
+        self._pairArcs = {}
 
     def _buildTerms(self):
         """ Builds a data structure indexing the terms
@@ -134,6 +198,14 @@ class PrimaryDirections:
 
     def G(self, ID, lat, lon):
         """ Creates a generic entry for an object. """
+        try:
+            point = self._points[ID]
+            if point['lat'] == lat and point['lon'] == lon:
+                return point
+            # The point has moved
+            self._clearCache()
+        except KeyError:
+            pass
 
         # Equatorial coordinates
         eqM = utils.eqCoords(lon, lat)
@@ -141,7 +213,7 @@ class PrimaryDirections:
         if lat != 0:
             eqZ = utils.eqCoords(lon, 0)
 
-        return {
+        point = {
             'id': ID,
             'lat': lat,
             'lon': lon,
@@ -150,6 +222,8 @@ class PrimaryDirections:
             'raZ': eqZ[0],
             'declZ': eqZ[1],
         }
+        self._points[ID] = point
+        return point
 
     def T(self, ID, sign):
         """ Returns the term of an object in a sign. """
@@ -195,6 +269,13 @@ class PrimaryDirections:
 
     # === Arcs === #
 
+    def _clearCache(self):
+        """ Clears the cached points and arcs. """
+        self._points.clear()
+        self._promArcs.clear()
+        self._sigArcs.clear()
+        self._pairArcs.clear()
+
     def _arc(self, prom, sig):
         """ Computes the in-zodiaco and in-mundo arcs 
         between a promissor and a significator.
@@ -211,6 +292,40 @@ class PrimaryDirections:
             'arcz': arcz
         }
 
+    def _promissorArcs(self, prom):
+        """ Returns the cached in-mundo and in-zodiaco
+        semi-arcs of a promissor.
+        
+        """
+        try:
+            return self._promArcs[prom['id']]
+        except KeyError:
+            res = (
+                promissorArcs(prom['ra'], prom['decl'],
+                              self.mcRA, self.lat),
+                promissorArcs(prom['raZ'], prom['declZ'],
+                              self.mcRA, self.lat)
+            )
+            self._promArcs[prom['id']] = res
+            return res
+
+    def _significatorArcs(self, sig):
+        """ Returns the cached in-mundo and in-zodiaco
+        semi-arcs of a significator.
+        
+        """
+        try:
+            return self._sigArcs[sig['id']]
+        except KeyError:
+            res = (
+                significatorArcs(sig['ra'], sig['decl'],
+                                 self.mcRA, self.lat),
+                significatorArcs(sig['raZ'], sig['declZ'],
+                                 self.mcRA, self.lat)
+            )
+            self._sigArcs[sig['id']] = res
+            return res
+
     def getArc(self, prom, sig):
         """ Returns the arcs between a promissor and
         a significator. Should uses the object creation 
@@ -271,26 +386,86 @@ class PrimaryDirections:
         cantiscias = self._elements(self.SIG_OBJECTS, self.C, [0])
         promissors = objects + terms + antiscias + cantiscias
 
-        # Compute all
+        # Compute only the pairs which are not cached
         res = []
+        maxArc = self.MAX_ARC
+        sigs = [(sig['id'], self._significatorArcs(sig))
+                for sig in significators]
         for prom in promissors:
-            for sig in significators:
-                if (prom['id'] == sig['id']):
+            promID = prom['id']
+            promArcs = None
+            pairArcs = self._pairArcs.setdefault(promID, {})
+            for (sigID, sigArcs) in sigs:
+                if promID == sigID:
                     continue
-                arcs = self._arc(prom, sig)
-                for (x, y) in [('arcm', 'M'), ('arcz', 'Z')]:
-                    arc = arcs[x]
-                    if 0 < arc < self.MAX_ARC:
-                        res.append([
-                            arcs[x],
-                            prom['id'],
-                            sig['id'],
-                            y,
-                        ])
+                arcs = pairArcs.get(sigID)
+                if arcs is None:
+                    if promArcs is None:
+                        promArcs = self._promissorArcs(prom)
+                    arcs = pairArcs[sigID] = [
+                        _pairArc(promArcs[0], sigArcs[0]),
+                        _pairArc(promArcs[1], sigArcs[1])
+                    ]
+                arcm, arcz = arcs
+                if 0 < arcm < maxArc:
+                    res.append([arcm, promID, sigID, 'M'])
+                if 0 < arcz < maxArc:
+                    res.append([arcz, promID, sigID, 'Z'])
 
         return sorted(res)
 
 
+# ---------------------------- #
+#   Solar Arc Table Class      #
+# ---------------------------- #
+
+class SolarArcTable:
+    """ This class represents a table of the arcs of 
+    the Sun's right ascension after a julian date, for
+    each day, which are the arcs of each year of the
+    true solar arc key.
+
+    The table is computed once for the largest arc and
+    years are interpolated between days. A table for a
+    zero arc has no days and cannot be interpolated.
+
+    """
+
+    def __init__(self, jd, maxArc):
+        self.jd = jd
+        self.arcs = [0.0]
+        ra = self._ra(jd)
+        while self.arcs[-1] < maxArc:
+            nextRA = self._ra(jd + len(self.arcs))
+            self.arcs.append(self.arcs[-1] + angle.distance(ra, nextRA))
+            ra = nextRA
+
+    def _ra(self, jd):
+        """ Returns the right ascension of the Sun. """
+        lon = swe.sweObjectLon(const.SUN, jd)
+        return utils.eqCoords(lon, 0)[0]
+
+    def _checkDays(self):
+        """ Raises ValueError if the table has no days. """
+        if len(self.arcs) < 2:
+            raise ValueError('Solar arc table of JD %s is empty' % self.jd)
+
+    def years(self, arc):
+        """ Returns the years of an arc. """
+        self._checkDays()
+        i = bisect.bisect_left(self.arcs, arc)
+        i = min(max(i, 1), len(self.arcs) - 1)
+        arc0, arc1 = self.arcs[i - 1], self.arcs[i]
+        return i - 1 + (arc - arc0) / (arc1 - arc0)
+
+    def arc(self, years):
+        """ Returns the arc of some years. """
+        self._checkDays()
+        i = min(max(int(years), 0), len(self.arcs) - 2)
+        arc0, arc1 = self.arcs[i], self.arcs[i + 1]
+        return arc0 + (years - i) * (arc1 - arc0)
+
+
 # ------------------ #
 #   PD Table Class   #
 # ------------------ #
@@ -299,35 +474,113 @@ class PDTable:
     """ Represents the Primary Directions table
     for a chart.
 
+    Directions are sorted by arc and indexed by
+    promissor and significator, so that queries do
+    not scan the whole table.
+
     """
 
     def __init__(self, chart, aspList=const.MAJOR_ASPECTS):
         pd = PrimaryDirections(chart)
+        self.chart = chart
         self.table = pd.getList(aspList)
+        self.arcs = [direction[0] for direction in self.table]
+
+        # Row positions of each promissor and significator
+        self._promissors = {}
+        self._significators = {}
+        for (i, direction) in enumerate(self.table):
+            self._promissors.setdefault(direction[1], []).append(i)
+            self._significators.setdefault(direction[2], []).append(i)
+
+        # Cached queries of each index, by ID
+        self._promissorQueries = {}
+        self._significatorQueries = {}
+        self._solarArcs = None
+
+    def _rows(self, index, queries, ID):
+        """ Returns the directions whose IDs in an index
+        include 'ID'. Queries are cached in 'queries'.
+
+        """
+        try:
+            return queries[ID]
+        except KeyError:
+            positions = []
+            for (k, rows) in index.items():
+                if ID in k:
+                    positions.extend(rows)
+            res = [self.table[i] for i in sorted(positions)]
+            queries[ID] = res
+            return res
 
     def view(self, arcmin, arcmax):
         """ Returns the directions within the
         min and max arcs.
 
         """
-        res = []
-        for direction in self.table:
-            if arcmin < direction[0] < arcmax:
-                res.append(direction)
-        return res
+        start = bisect.bisect_right(self.arcs, arcmin)
+        end = bisect.bisect_left(self.arcs, arcmax)
+        return self.table[start:end]
 
     def bySignificator(self, ID):
         """ Returns all directions to a significator. """
-        res = []
-        for direction in self.table:
-            if ID in direction[2]:
-                res.append(direction)
-        return res
+        return list(self._rows(self._significators,
+                               self._significatorQueries, ID))
 
     def byPromissor(self, ID):
         """ Returns all directions to a promissor. """
-        res = []
-        for direction in self.table:
-            if ID in direction[1]:
-                res.append(direction)
-        return res
+        return list(self._rows(self._promissors,
+                               self._promissorQueries, ID))
+
+    # === Time keys === #
+
+    def _solarArcTable(self):
+        """ Returns the solar arc table of the chart, 
+        which is computed once for the largest arc.
+
+        """
+        if self._solarArcs is None:
+            maxArc = self.arcs[-1] if self.arcs else 0
+            with self.chart.context:
+                self._solarArcs = SolarArcTable(self.chart.date.jd,
+                                                maxArc)
+        return self._solarArcs
+
+    def years(self, arc, key=NAIBOD):
+        """ Returns the years of an arc for a time key. """
+        if key == TRUE_SOLAR_ARC:
+            return self._solarArcTable().years(arc)
+        return arc / KEY_RATES[key]
+
+    def arc(self, years, key=NAIBOD):
+        """ Returns the arc of some years for a time key. """
+        if key == TRUE_SOLAR_ARC:
+            return self._solarArcTable().arc(years)
+        return years * KEY_RATES[key]
+
+    def getDates(self, key=NAIBOD, directions=None):
+        """ Returns the dates of a list of directions for
+        a time key, which are all directions by default.
+
+        """
+        if directions is None:
+            directions = self.table
+        jd = self.chart.date.jd
+        utcoffset = self.chart.date.utcoffset
+        return [Datetime.fromJD(
+                    jd + self.years(direction[0], key) * const.YEAR,
+                    utcoffset
+                ) for direction in directions]
+
+    def viewDates(self, start, end, key=NAIBOD):
+        """ Returns the directions between two dates 
+        for a time key.
+
+        """
+        if not self.table:
+            return []
+        jd = self.chart.date.jd
+        arcmin = self.arc((start.jd - jd) / const.YEAR, key)
+        arcmax = self.arc((end.jd - jd) / const.YEAR, key)
+        return self.view(arcmin, arcmax)
@@ -8,9 +8,16 @@
     
 """
 
-import math
+import bisect
+from array import array
+
+from flatlib import angle
 from flatlib import const
 from flatlib.ephem import ephem
+from flatlib.ephem import tools
+
+# Default years of profection timelines
+YEARS = 120
 
 
 def compute(chart, date, fixedObjects=False):
@@ -21,14 +28,15 @@ def compute(chart, date, fixedObjects=False):
     """
 
     sun = chart.getObject(const.SUN)
-    prevSr = ephem.prevSolarReturn(date, sun.lon)
-    nextSr = ephem.nextSolarReturn(date, sun.lon)
+    with chart.context:
+        prevSr = ephem.prevSolarReturn(date, sun.lon)
+        nextSr = ephem.nextSolarReturn(date, sun.lon)
 
     # In one year, rotate chart 30º
     rotation = 30 * (date.jd - prevSr.jd) / (nextSr.jd - prevSr.jd)
 
-    # Include 30º for each previous year
-    age = math.floor((date.jd - chart.date.jd) / 365.25)
+    # Include 30º for each previous solar return
+    age = round((prevSr.jd - chart.date.jd) / const.YEAR)
     rotation = 30 * age + rotation
 
     # Create a copy of the chart and rotate content
@@ -42,3 +50,96 @@ def compute(chart, date, fixedObjects=False):
         angle.relocate(angle.lon + rotation)
 
     return pChart
+
+
+# ---------------------------------- #
+#   Profection Timeline Class        #
+# ---------------------------------- #
+
+class ProfectionTimeline:
+    """ This class represents the profections of a chart
+    over a range of years.
+
+    The solar returns of the native are computed once, so
+    that the rotation of any julian date is found with a
+    bisection of the returns. The rotation is 30 degrees
+    for each completed year plus the interpolated part of
+    the current year.
+
+    """
+
+    def __init__(self, chart, years=YEARS):
+        self.chart = chart
+        self.objects = [obj.id for obj in chart.objects]
+        self.houses = [house.id for house in chart.houses]
+        self.angles = [obj.id for obj in chart.angles]
+        self._lons = {
+            'objects': [obj.lon for obj in chart.objects],
+            'houses': [house.lon for house in chart.houses],
+            'angles': [obj.lon for obj in chart.angles]
+        }
+
+        # Solar returns for each age
+        lon = chart.getObject(const.SUN).lon
+        self.returns = [chart.date.jd]
+        with chart.context:
+            for i in range(years):
+                jd = self.returns[-1] + const.YEAR
+                self.returns.append(tools.lonCrossingJD(const.SUN, lon, jd))
+
+    def rotation(self, jd):
+        """ Returns the rotation (in degrees) of a 
+        julian date.
+
+        """
+        i = bisect.bisect_right(self.returns, jd) - 1
+        if not 0 <= i < len(self.returns) - 1:
+            raise ValueError('JD %s is outside the timeline' % jd)
+        prevSr, nextSr = self.returns[i], self.returns[i + 1]
+        return 30 * (i + (jd - prevSr) / (nextSr - prevSr))
+
+    def rotations(self, jds):
+        """ Returns an array with the rotations of a
+        sequence of julian dates.
+
+        """
+        return array('d', (self.rotation(jd) for jd in jds))
+
+    def lons(self, jd, fixedObjects=False):
+        """ Returns a dict with lists of the rotated 
+        longitudes of the 'objects', 'houses' and 'angles'
+        for a julian date, in the order of the IDs of this 
+        timeline. Receives argument 'fixedObjects' to fix
+        objects in their natal locations.
+
+        """
+        rotation = self.rotation(jd)
+        res = {}
+        for (key, lons) in self._lons.items():
+            if key == 'objects' and fixedObjects:
+                res[key] = list(lons)
+            else:
+                res[key] = [angle.norm(lon + rotation) for lon in lons]
+        return res
+
+    def series(self, jds, fixedObjects=False):
+        """ Returns the rotated longitudes of a sequence of
+        julian dates.
+
+        The result is a dict with contiguous 'objects', 
+        'houses' and 'angles' arrays of doubles, each with
+        len(jds) rows by the number of IDs in row-major 
+        order, and the 'rotation' array of the dates.
+
+        """
+        rotations = self.rotations(jds)
+        res = {'rotation': rotations}
+        for (key, lons) in self._lons.items():
+            values = array('d')
+            for rotation in rotations:
+                if key == 'objects' and fixedObjects:
+                    values.extend(lons)
+                else:
+                    values.extend(angle.norm(lon + rotation) for lon in lons)
+            res[key] = values
+        return res
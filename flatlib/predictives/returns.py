@@ -22,7 +22,8 @@ def _computeChart(chart, date):
     pos = chart.pos
     hsys = chart.hsys
     IDs = [obj.id for obj in chart.objects]
-    return Chart(date, pos, IDs=IDs, hsys=hsys)
+    return Chart(date, pos, IDs=IDs, hsys=hsys,
+                 context=chart.context, config=chart.config)
 
 
 def nextSolarReturn(chart, date):
@@ -31,7 +32,8 @@ def nextSolarReturn(chart, date):
     
     """
     sun = chart.getObject(const.SUN)
-    srDate = ephem.nextSolarReturn(date, sun.lon)
+    with chart.context:
+        srDate = ephem.nextSolarReturn(date, sun.lon)
     return _computeChart(chart, srDate)
 
 
@@ -41,5 +43,6 @@ def prevSolarReturn(chart, date):
     
     """
     sun = chart.getObject(const.SUN)
-    srDate = ephem.prevSolarReturn(date, sun.lon)
+    with chart.context:
+        srDate = ephem.prevSolarReturn(date, sun.lon)
     return _computeChart(chart, srDate)
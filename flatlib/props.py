@@ -195,6 +195,19 @@ class object:
         const.SYZYGY: 0.0
     }
 
+    # Synodic periods of the planets (days)
+    synodicPeriod = {
+        const.MERCURY: 115.88,
+        const.VENUS: 583.92,
+        const.MARS: 779.94,
+        const.JUPITER: 398.88,
+        const.SATURN: 378.09,
+        const.URANUS: 369.66,
+        const.NEPTUNE: 367.49,
+        const.PLUTO: 366.73,
+        const.CHIRON: 372.61
+    }
+
     # Object orbs
     orb = {
         const.NO_PLANET: 0,
@@ -307,6 +320,9 @@ class house:
         const.HOUSE4, const.HOUSE5, const.HOUSE6
     ]
 
+    # Table indexed by const.HOUSE_INDEX
+    aboveHorizonList = list(map(aboveHorizon.__contains__, _houses))
+
 
 # --------------------- #
 #   Aspect Properties   #
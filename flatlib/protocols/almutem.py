@@ -69,7 +69,8 @@ def compute(chart):
     ]
     for hyleg in hylegic:
         row = newRow()
-        digInfo = essential.getInfo(hyleg.sign, hyleg.signlon)
+        digInfo = essential.getInfo(hyleg.sign, hyleg.signlon,
+                                      chart.config)
 
         # Add the scores of each planet where hyleg has dignities
         for dignity in DIGNITY_LIST:
@@ -83,9 +84,10 @@ def compute(chart):
 
     # House positions
     row = newRow()
+    objList = [chart.getObject(objID) for objID in OBJECT_LIST]
+    houses = chart.houses.getObjectsHouses(objList)
     for objID in OBJECT_LIST:
-        obj = chart.getObject(objID)
-        house = chart.houses.getObjectHouse(obj)
+        house = houses[objID]
         score = HOUSE_SCORES[house.id]
         row[objID]['string'] = '+%s' % score
         row[objID]['score'] = score
@@ -42,8 +42,10 @@ def compute(chart):
     # Planets conjunct Moon or Mercury
     moon = chart.get(const.MOON)
     mercury = chart.get(const.MERCURY)
-    planetsConjMoon = chart.objects.getObjectsAspecting(moon, [0])
-    planetsConjMercury = chart.objects.getObjectsAspecting(mercury, [0])
+    matrix = chart.getAspectMatrix([0])
+    planetsConjMoon = chart.objects.getObjectsAspecting(moon, [0], matrix)
+    planetsConjMercury = chart.objects.getObjectsAspecting(mercury, [0],
+                                                           matrix)
 
     _set = _merge(planetsConjMoon, planetsConjMercury)
     factors.append(['Planets Conj Moon or Mercury', _set])
@@ -55,13 +57,17 @@ def compute(chart):
     disposer = chart.getObject(disposerID)
 
     _set = []
-    if aspects.isAspecting(disposer, ascRuler, const.MAJOR_ASPECTS):
+    aspList = const.MAJOR_ASPECTS
+    matrix = chart.getAspectMatrix(aspList)
+    if aspects.isAspecting(disposer, ascRuler, aspList, matrix):
         _set = [ascRuler.id]
     factors.append(['Asc Ruler if aspected by its disposer', _set]);
 
     # Planets aspecting Moon or Mercury
-    aspMoon = chart.objects.getObjectsAspecting(moon, [60, 90, 120, 180])
-    aspMercury = chart.objects.getObjectsAspecting(mercury, [60, 90, 120, 180])
+    aspList = [60, 90, 120, 180]
+    matrix = chart.getAspectMatrix(aspList)
+    aspMoon = chart.objects.getObjectsAspecting(moon, aspList, matrix)
+    aspMercury = chart.objects.getObjectsAspecting(mercury, aspList, matrix)
 
     _set = _merge(aspMoon, aspMercury)
     factors.append(['Planets Asp Moon or Mercury', _set])
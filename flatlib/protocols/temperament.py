@@ -89,7 +89,8 @@ def singleFactor(factors, chart, factor, obj, aspect=None):
 def modifierFactor(chart, factor, factorObj, otherObj, aspList):
     """ Computes a factor for a modifier. """
 
-    asp = aspects.aspectType(factorObj, otherObj, aspList)
+    matrix = chart.getAspectMatrix(aspList)
+    asp = aspects.aspectType(factorObj, otherObj, aspList, matrix)
     if asp != const.NO_ASPECT:
         return {
             'factor': factor,
@@ -149,15 +150,17 @@ def getFactors(chart):
     moonFactor['planetID'] = moonRulerID  # Append moon dispositor ID
 
     # Planets conjunct Moon
-    planetsConjMoon = chart.objects.getObjectsAspecting(moon, [0])
+    matrix = chart.getAspectMatrix([0])
+    planetsConjMoon = chart.objects.getObjectsAspecting(moon, [0], matrix)
     for obj in planetsConjMoon:
         singleFactor(factors, chart, MOON_PLANETS_CONJ, obj)
 
     # Planets aspecting Moon
     aspList = [60, 90, 120, 180]
-    planetsAspMoon = chart.objects.getObjectsAspecting(moon, aspList)
+    matrix = chart.getAspectMatrix(aspList)
+    planetsAspMoon = chart.objects.getObjectsAspecting(moon, aspList, matrix)
     for obj in planetsAspMoon:
-        aspect = aspects.aspectType(obj, moon, aspList)
+        aspect = aspects.aspectType(obj, moon, aspList, matrix)
         singleFactor(factors, chart, MOON_PLANETS_ASP, obj, aspect)
 
     # Sun season
@@ -21,13 +21,15 @@ class ChartDynamics:
 
     def __init__(self, chart):
         self.chart = chart
+        self._receptions = {}
 
     # === Dignities and Mutual Reception === #
 
     def inDignities(self, idA, idB):
         """ Returns the dignities of A which belong to B. """
         objA = self.chart.get(idA)
-        info = essential.getInfo(objA.sign, objA.signlon)
+        info = essential.getInfo(objA.sign, objA.signlon,
+                                 self.chart.config)
         # Should we ignore exile and fall?
         return [dign for (dign, ID) in info.items() if ID == idB]
 
@@ -39,7 +41,9 @@ class ChartDynamics:
         """
         objA = self.chart.get(idA)
         objB = self.chart.get(idB)
-        asp = aspects.isAspecting(objB, objA, const.MAJOR_ASPECTS)
+        aspList = const.MAJOR_ASPECTS
+        matrix = self.chart.getAspectMatrix(aspList)
+        asp = aspects.isAspecting(objB, objA, aspList, matrix)
         return self.inDignities(idB, idA) if asp else []
 
     def disposits(self, idA, idB):
@@ -53,12 +57,35 @@ class ChartDynamics:
         # Returns a product of both lists
         return [(a, b) for a in AB for b in BA]
 
+    def _receptionKey(self, idA, idB):
+        """ Returns the cache key of the receptions of
+        two objects, including their positions.
+        
+        """
+        objA = self.chart.get(idA)
+        objB = self.chart.get(idB)
+        return (idA, objA.lon, objA.lonspeed,
+                idB, objB.lon, objB.lonspeed)
+
     def reMutualReceptions(self, idA, idB):
-        """ Returns ruler and exaltation mutual receptions. """
-        mr = self.mutualReceptions(idA, idB)
-        filter_ = ['ruler', 'exalt']
+        """ Returns ruler and exaltation mutual receptions. 
+        Results are cached for both orders of the objects.
+        
+        """
+        key = self._receptionKey(idA, idB)
+        try:
+            return self._receptions[key]
+        except KeyError:
+            pass
+
         # Each pair of dignities must be 'ruler' or 'exalt'
-        return [(a, b) for (a, b) in mr if (a in filter_ and b in filter_)]
+        filter_ = ['ruler', 'exalt']
+        AB = [a for a in self.receives(idA, idB) if a in filter_]
+        BA = [b for b in self.receives(idB, idA) if b in filter_]
+        self._receptions[key] = [(a, b) for a in AB for b in BA]
+        reverse = self._receptionKey(idB, idA)
+        self._receptions[reverse] = [(b, a) for b in BA for a in AB]
+        return self._receptions[key]
 
     # === Aspects === #
 
@@ -69,6 +96,7 @@ class ChartDynamics:
         
         """
         obj = self.chart.getObject(ID)
+        matrix = self.chart.getAspectMatrix(aspList)
         res = []
 
         for otherID in const.LIST_SEVEN_PLANETS:
@@ -76,7 +104,7 @@ class ChartDynamics:
                 continue
 
             otherObj = self.chart.getObject(otherID)
-            aspType = aspects.aspectType(obj, otherObj, aspList)
+            aspType = aspects.aspectType(obj, otherObj, aspList, matrix)
             if aspType != const.NO_ASPECT:
                 res.append({
                     'id': otherID,
@@ -99,10 +127,11 @@ class ChartDynamics:
         }
 
         objA = self.chart.getObject(ID)
+        matrix = self.chart.getAspectMatrix(aspList)
         valid = self.validAspects(ID, aspList)
         for elem in valid:
             objB = self.chart.getObject(elem['id'])
-            asp = aspects.getAspect(objA, objB, aspList)
+            asp = aspects.getAspect(objA, objB, aspList, matrix)
             role = asp.getRole(objA.id)
             if role['inOrb']:
                 movement = role['movement']
@@ -0,0 +1,33 @@
+import asyncio
+import unittest
+
+from flatlib import aio
+from flatlib import const
+from flatlib.chart import Chart
+from flatlib.datetime import Datetime
+from flatlib.geopos import GeoPos
+
+
+class AioTests(unittest.TestCase):
+
+    def setUp(self):
+        self.date = Datetime('2015/03/13', '17:00', '+00:00')
+        self.pos = GeoPos('38n32', '8w54')
+
+    def test_async_charts(self):
+        """Identical async requests must share the same chart."""
+        service = aio.ChartService(maxPending=2)
+
+        async def compute():
+            requests = [service.achart(self.date, self.pos)
+                        for i in range(10)]
+            return await asyncio.gather(*requests)
+
+        charts = asyncio.run(compute())
+        service.shutdown()
+        self.assertTrue(all(chart is charts[0] for chart in charts))
+        self.assertEqual(str(charts[0].getObject(const.SUN)),
+                         str(Chart(self.date, self.pos).getObject(const.SUN)))
+        metrics = service.metrics()
+        self.assertEqual(metrics['coalesced'], 9)
+        self.assertEqual(metrics['inflight'], 0)
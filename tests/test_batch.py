@@ -0,0 +1,32 @@
+import unittest
+
+from flatlib import batch
+from flatlib import const
+from flatlib.chart import Chart
+from flatlib.datetime import Datetime
+from flatlib.geopos import GeoPos
+
+
+class BatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.date = Datetime('2015/03/13', '17:00', '+00:00')
+        self.pos = GeoPos('38n32', '8w54')
+
+    def test_batch_charts(self):
+        """Batch records must match charts and keep their order."""
+        data = {
+            'date': ['2015/03/%02d' % day for day in range(1, 11)],
+            'time': ['17:00'] * 10,
+            'utcoffset': ['+00:00'] * 10,
+            'lat': ['38n32'] * 10,
+            'lon': ['8w54'] * 10
+        }
+        records = list(batch.computeCharts(data, workers=2, chunkSize=3))
+        self.assertEqual(len(records), 10)
+        for (date, record) in zip(data['date'], records):
+            chart = Chart(Datetime(date, '17:00', '+00:00'), self.pos)
+            sun = chart.getObject(const.SUN)
+            self.assertEqual(record['objects'][const.SUN][0], sun.lon)
+            self.assertEqual(record['angles'][const.ASC],
+                             chart.getAngle(const.ASC).lon)
@@ -1,8 +1,14 @@
+import itertools
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
+from flatlib import aspects
 from flatlib import const
-from flatlib.chart import Chart
+from flatlib.chart import Chart, LazyChart
 from flatlib.datetime import Datetime
+from flatlib.dignities import essential
+from flatlib.ephem import swe
+from flatlib.ephem import context
 from flatlib.geopos import GeoPos
 
 
@@ -17,3 +23,77 @@ class ChartTests(unittest.TestCase):
         chart = Chart(self.date, self.pos, hsys=const.HOUSES_MORINUS)
         sr_chart = chart.solarReturn(2018)
         self.assertEqual(chart.hsys, sr_chart.hsys)
+
+    def test_pars_fortuna_hsys(self):
+        """Pars Fortuna must reuse the houses of the chart."""
+        swe.clearCache()
+        IDs = const.LIST_OBJECTS_TRADITIONAL + [const.PARS_FORTUNA]
+        chart = Chart(self.date, self.pos, hsys=const.HOUSES_PLACIDUS,
+                      IDs=IDs)
+        self.assertEqual(swe.cacheInfo()['houses']['misses'], 1)
+        pars = chart.getObject(const.PARS_FORTUNA)
+        other = Chart(self.date, self.pos, IDs=IDs)
+        self.assertEqual(pars.lon, other.getObject(const.PARS_FORTUNA).lon)
+
+    def test_lazy_chart(self):
+        """Lazy charts must have the same content as charts."""
+        chart = Chart(self.date, self.pos)
+        lazy = LazyChart(self.date, self.pos)
+        self.assertEqual(str(chart.getObject(const.SUN)),
+                         str(lazy.getObject(const.SUN)))
+        self.assertEqual(str(chart.getAngle(const.ASC)),
+                         str(lazy.getAngle(const.ASC)))
+        self.assertEqual([str(obj) for obj in chart.objects],
+                         [str(obj) for obj in lazy.objects])
+
+    def test_aspect_matrix(self):
+        """Aspect matrices must match pairwise aspects."""
+        chart = Chart(self.date, self.pos, IDs=const.LIST_OBJECTS)
+        aspList = const.ALL_ASPECTS
+        matrix = aspects.AspectMatrix(chart.objects, aspList)
+        for (obj1, obj2) in itertools.permutations(chart.objects, 2):
+            self.assertEqual(aspects.aspectType(obj1, obj2, aspList),
+                             matrix.aspectType(obj1.id, obj2.id))
+            self.assertEqual(aspects.isAspecting(obj1, obj2, aspList),
+                             matrix.isAspecting(obj1.id, obj2.id))
+            self.assertEqual(str(aspects.getAspect(obj1, obj2, aspList)),
+                             str(matrix.getAspect(obj1.id, obj2.id)))
+
+    def test_aspect_matrix_cache(self):
+        """Cached aspect matrices must be rebuilt after relocations."""
+        chart = Chart(self.date, self.pos)
+        matrix = chart.getAspectMatrix(const.MAJOR_ASPECTS)
+        self.assertIs(matrix, chart.getAspectMatrix(const.MAJOR_ASPECTS))
+        sun = chart.getObject(const.SUN)
+        sun.relocate(sun.lon + 10)
+        self.assertIsNot(matrix, chart.getAspectMatrix(const.MAJOR_ASPECTS))
+
+    def test_house_by_lon(self):
+        """House lookups must match the cusps and offsets."""
+        chart = Chart(self.date, self.pos, hsys=const.HOUSES_PLACIDUS)
+        lons = [i * 0.5 for i in range(720)]
+        houses = chart.houses.getHousesByLon(lons)
+        for (lon, house) in zip(lons, houses):
+            expected = [h for h in chart.houses if h.inHouse(lon)]
+            self.assertEqual([house], expected)
+
+    def test_contexts(self):
+        """Charts in threads must match charts of their context."""
+        ctx = context.EphemerisContext(hsys=const.HOUSES_MORINUS)
+        config = essential.DignityConfig(terms=essential.LILLY_TERMS)
+
+        def compute(args):
+            ctx, config = args
+            chart = Chart(self.date, self.pos, context=ctx, config=config)
+            sun = chart.getObject(const.SUN)
+            return (chart.hsys, [house.lon for house in chart.houses],
+                    essential.getInfo(sun.sign, sun.signlon, chart.config))
+
+        args = [(context.DEFAULT, None), (ctx, config)] * 4
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(compute, args))
+        self.assertEqual(results, [compute(arg) for arg in args])
+        self.assertEqual(results[1][0], const.HOUSES_MORINUS)
+        with ctx:
+            self.assertEqual(Chart(self.date, self.pos).hsys,
+                             const.HOUSES_MORINUS)
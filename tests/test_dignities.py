@@ -0,0 +1,92 @@
+import unittest
+
+from flatlib import const
+from flatlib.chart import Chart
+from flatlib.datetime import Datetime
+from flatlib.dignities import accidental
+from flatlib.dignities import essential
+from flatlib.geopos import GeoPos
+
+
+class DignitiesTests(unittest.TestCase):
+
+    def setUp(self):
+        self.date = Datetime('2015/03/13', '17:00', '+00:00')
+        self.pos = GeoPos('38n32', '8w54')
+
+    def test_score_chart(self):
+        """Chart scores must match the scores of each object."""
+        chart = Chart(self.date, self.pos)
+        scores = accidental.scoreChart(chart)
+        for ID in const.LIST_SEVEN_PLANETS:
+            obj = chart.getObject(ID)
+            accDig = accidental.AccidentalDignity(obj, chart)
+            self.assertEqual(scores[ID], accDig.getScoreProperties())
+
+    def test_essential_tables(self):
+        """Table dignities must match the direct computation."""
+        for terms in [essential.EGYPTIAN_TERMS, essential.TETRABIBLOS_TERMS,
+                      essential.LILLY_TERMS]:
+            config = essential.DignityConfig(terms=terms)
+            for sign in const.LIST_SIGNS:
+                for lon in [deg + frac for deg in range(30)
+                            for frac in [0, 0.5, 0.999]]:
+                    info = {
+                        'ruler': essential.ruler(sign),
+                        'exalt': essential.exalt(sign),
+                        'dayTrip': essential.dayTrip(sign),
+                        'nightTrip': essential.nightTrip(sign),
+                        'partTrip': essential.partTrip(sign),
+                        'term': essential.term(sign, lon, config),
+                        'face': essential.face(sign, lon, config),
+                        'exile': essential.exile(sign),
+                        'fall': essential.fall(sign)
+                    }
+                    self.assertEqual(essential.getInfo(sign, lon, config),
+                                     info)
+                    scores = dict((ID, sum(essential.SCORES[dign]
+                                           for (dign, objID) in info.items()
+                                           if objID == ID))
+                                  for ID in const.LIST_SEVEN_PLANETS)
+                    for ID in const.LIST_SEVEN_PLANETS:
+                        self.assertEqual(
+                            essential.score(ID, sign, lon, config),
+                            scores[ID])
+                        self.assertEqual(
+                            essential.isPeregrine(ID, sign, lon, config),
+                            ID not in [objID for (dign, objID) in info.items()
+                                       if dign not in ['exile', 'fall']])
+                    best = max(scores.values())
+                    almutem = essential.almutem(sign, lon, config)
+                    if best > 0:
+                        self.assertEqual(scores[almutem], best)
+                    else:
+                        self.assertIsNone(almutem)
+
+    def test_essential_scores(self):
+        """Tables must be rebuilt after changes to the scores."""
+        before = essential.score(const.SUN, const.LEO, 10)
+        essential.SCORES['ruler'] += 1
+        try:
+            essential.clearTables()
+            self.assertEqual(essential.score(const.SUN, const.LEO, 10),
+                             before + 1)
+        finally:
+            essential.SCORES['ruler'] -= 1
+            essential.clearTables()
+
+    def test_essential_variants(self):
+        """Default tables must follow the terms and faces variants."""
+        lon = 14.5
+        try:
+            for terms in [essential.LILLY_TERMS, essential.EGYPTIAN_TERMS]:
+                essential.setTerms(terms)
+                essential.setFaces(essential.TRIPLICITY_FACES)
+                config = essential.DignityConfig(
+                    terms, essential.TRIPLICITY_FACES)
+                for sign in const.LIST_SIGNS:
+                    self.assertEqual(essential.getInfo(sign, lon),
+                                     essential.getInfo(sign, lon, config))
+        finally:
+            essential.setTerms(essential.EGYPTIAN_TERMS)
+            essential.setFaces(essential.CHALDEAN_FACES)
@@ -0,0 +1,192 @@
+import os
+import tempfile
+import unittest
+
+from flatlib import angle
+from flatlib import const
+from flatlib.datetime import Datetime
+from flatlib.geopos import GeoPos
+from flatlib.ephem import chebyshev
+from flatlib.ephem import eph
+from flatlib.ephem import events
+from flatlib.ephem import ephem
+from flatlib.ephem import fixedstars
+from flatlib.ephem import swe
+from flatlib.ephem import tools
+
+
+class EphemTests(unittest.TestCase):
+
+    def setUp(self):
+        self.date = Datetime('2015/03/13', '17:00', '+00:00')
+        self.pos = GeoPos('38n32', '8w54')
+
+    def test_object_list(self):
+        """Batched object lists must match single object calls."""
+        objList = ephem.getObjectList(const.LIST_OBJECTS, self.date, self.pos)
+        for obj in objList:
+            other = ephem.getObject(obj.id, self.date, self.pos)
+            self.assertEqual(obj.toDict(), other.toDict())
+
+    def test_object_series(self):
+        """Time series must match single object calls."""
+        IDs = [const.SUN, const.MOON, const.SOUTH_NODE]
+        jds = [self.date.jd + i for i in range(5)]
+        series = eph.getObjectSeries(IDs, jds)
+        for (row, jd) in enumerate(jds):
+            for (col, ID) in enumerate(IDs):
+                obj = eph.getObject(ID, jd, self.pos.lat, self.pos.lon)
+                for key in ['lon', 'lat', 'lonspeed', 'latspeed']:
+                    value = series[key][row * len(IDs) + col]
+                    self.assertEqual(obj[key], value)
+
+    def test_chebyshev_cache(self):
+        """Cached positions must be within the maximum error."""
+        cache = chebyshev.ChebyshevCache()
+        for i in range(50):
+            jd = self.date.jd + i * 0.37
+            lon, lat, _, _ = cache.get(const.MOON, jd)
+            obj = swe.sweObject(const.MOON, jd)
+            self.assertLessEqual(abs(angle.closestdistance(obj['lon'], lon)),
+                                 cache.maxError)
+            self.assertLessEqual(abs(obj['lat'] - lat), cache.maxError)
+
+        # Saved caches must evaluate the same positions
+        with tempfile.TemporaryDirectory() as path:
+            path = os.path.join(path, 'cache.json')
+            cache.save(path)
+            loaded = chebyshev.ChebyshevCache.load(path)
+        jd = self.date.jd + 5.5
+        self.assertEqual(cache.get(const.MOON, jd),
+                         loaded.get(const.MOON, jd))
+
+        # Changing the path must clear the enabled cache
+        swe.setCache(cache)
+        try:
+            swe.setPath(swe.getPath())
+            self.assertEqual(cache.segments[const.MOON], {})
+        finally:
+            swe.setCache(None)
+
+    def test_lru_cache(self):
+        """Repeated lookups must hit the LRU caches."""
+        swe.clearCache()
+        ephem.getHouses(self.date, self.pos, const.HOUSES_DEFAULT)
+        ephem.getObject(const.PARS_FORTUNA, self.date, self.pos)
+        info = swe.cacheInfo()
+        self.assertEqual(info['houses']['misses'], 1)
+        self.assertEqual(info['houses']['hits'], 2)
+
+    def test_fixed_star_list(self):
+        """Catalog stars must match the Swiss Ephemeris."""
+        IDs = const.LIST_FIXED_STARS
+        starList = ephem.getFixedStarList(IDs, self.date)
+        for star in starList:
+            other = ephem.getFixedStar(star.id, self.date)
+            dist = angle.closestdistance(star.lon, other.lon)
+            self.assertLess(abs(dist), 0.0005)
+            self.assertLess(abs(star.lat - other.lat), 0.0005)
+            self.assertEqual(star.mag, other.mag)
+
+    def test_fixed_star_list_past(self):
+        """Catalog stars must match the Swiss Ephemeris in the past."""
+        IDs = const.LIST_FIXED_STARS + ['Rigel Kentaurus', 'Arcturus']
+        for date in ['1000/03/13', '1500/03/13', '0500/03/13']:
+            jd = Datetime(date, '17:00', '+00:00').jd
+            starList = eph.getFixedStarList(IDs, jd)
+            for star in starList:
+                other = eph.getFixedStar(star['id'], jd)
+                dist = angle.closestdistance(star['lon'], other['lon'])
+                self.assertLess(abs(dist), 0.0005)
+                self.assertLess(abs(star['lat'] - other['lat']), 0.0005)
+        self.assertFalse(fixedstars.getCatalog().covers(jd))
+
+    def test_fixed_star_repeated_names(self):
+        """Repeated star names must match the Swiss Ephemeris."""
+        catalog = fixedstars.getCatalog()
+        keys = [name.replace(' ', '').lower() for name in catalog.names]
+        IDs = set(name for (name, key) in zip(catalog.names, keys)
+                  if keys.count(key) > 1)
+        self.assertTrue(IDs)
+        for star in eph.getFixedStarList(sorted(IDs), self.date.jd):
+            other = eph.getFixedStar(star['id'], self.date.jd)
+            dist = angle.closestdistance(star['lon'], other['lon'])
+            self.assertLess(abs(dist), 0.0005)
+            self.assertLess(abs(star['lat'] - other['lat']), 0.0005)
+            self.assertEqual(star['mag'], other['mag'])
+
+    def test_stars_aspecting(self):
+        """Indexed conjunctions must match a linear scan."""
+        starList = ephem.getFixedStarList(const.LIST_FIXED_STARS, self.date)
+        objList = ephem.getObjectList(const.LIST_OBJECTS, self.date, self.pos)
+        res = starList.getStarsAspectingList(objList)
+        for obj in objList:
+            expected = [star.id for star in starList if star.aspects(obj)]
+            self.assertEqual(sorted(expected),
+                             sorted(star.id for star in res[obj.id]))
+
+    def test_stars_aspecting_relocated(self):
+        """Relocated stars must be found by the index."""
+        starList = ephem.getFixedStarList(const.LIST_FIXED_STARS, self.date)
+        sun = ephem.getObject(const.SUN, self.date, self.pos)
+        starList.getStarsAspecting(sun)
+        star = starList.get(const.STAR_REGULUS)
+        star.relocate(sun.lon + 0.5)
+        res = starList.getStarsAspecting(sun)
+        self.assertIn(const.STAR_REGULUS, [star.id for star in res])
+
+    def test_longitude_crossings(self):
+        """Solar returns and syzygies must be within the maximum error."""
+        jd = self.date.jd
+        for lon in [0.0, 95.5, 352.8]:
+            srjd = tools.solarReturnJD(jd, lon)
+            self.assertTrue(jd < srjd < jd + 366)
+            sun = swe.sweObjectLon(const.SUN, srjd)
+            self.assertLess(abs(angle.closestdistance(sun, lon)),
+                            tools.MAX_ERROR)
+        for i in range(30):
+            szjd = tools.syzygyJD(jd + i)
+            self.assertTrue(jd + i - 16 < szjd <= jd + i)
+            sun = swe.sweObjectLon(const.SUN, szjd)
+            moon = swe.sweObjectLon(const.MOON, szjd)
+            dist = abs(angle.closestdistance(sun, moon))
+            self.assertLess(min(dist, 180 - dist), tools.MAX_ERROR)
+
+    def test_no_convergence(self):
+        """Iterations without a root must raise ValueError."""
+        with self.assertRaises(ValueError):
+            tools.newtonJD(lambda jd: (1.0, 1e-9), 0.0, neg=-1.0, pos=1.0)
+        with self.assertRaises(ValueError):
+            tools.secantJD(lambda jd: 1.0 if jd > 0 else -1.0,
+                           -1.0, 1.0, -1.0, 1.0, error=0.0)
+
+    def test_stations(self):
+        """Stations must be found where the speed changes sign."""
+        start = self.date.jd
+        end = start + 3 * 365.25
+        jds = tools.stationsJD(const.MERCURY, start, end)
+        speeds = [swe.sweObjectLonSpeed(const.MERCURY, start + i)[1]
+                  for i in range(int(end - start) + 1)]
+        changes = sum(1 for (s1, s2) in zip(speeds, speeds[1:])
+                      if s1 * s2 < 0)
+        self.assertEqual(len(jds), changes)
+        for jd in jds:
+            before = swe.sweObjectLonSpeed(const.MERCURY, jd - 1e-4)[1]
+            after = swe.sweObjectLonSpeed(const.MERCURY, jd + 1e-4)[1]
+            self.assertLess(before * after, 0)
+        self.assertEqual(tools.nextStationJD(const.MERCURY, start), jds[0])
+
+    def test_events(self):
+        """Events must be in time order and match their searches."""
+        start = self.date.jd
+        end = start + 365.25
+        jds = [event['jd'] for event in events.getEvents(start, end)]
+        self.assertEqual(jds, sorted(jds))
+        for event in events.lunations(start, end):
+            self.assertAlmostEqual(event['jd'],
+                                   tools.syzygyJD(event['jd'] + 0.01),
+                                   places=4)
+        for event in events.ingresses(const.MERCURY, start, end):
+            lon = swe.sweObjectLon(const.MERCURY, event['jd'] + 0.01)
+            self.assertEqual(const.LIST_SIGNS[int(lon // 30)],
+                             event['sign'])
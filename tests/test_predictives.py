@@ -0,0 +1,149 @@
+import itertools
+import unittest
+
+import swisseph
+
+from flatlib import angle
+from flatlib import const
+from flatlib import utils
+from flatlib.chart import Chart
+from flatlib.datetime import Datetime
+from flatlib.dignities import essential
+from flatlib.ephem import swe
+from flatlib.ephem import tools
+from flatlib.ephem import context
+from flatlib.geopos import GeoPos
+from flatlib.predictives import primarydirections
+from flatlib.predictives import profections
+from flatlib.predictives import returns
+
+
+class PredictivesTests(unittest.TestCase):
+
+    def setUp(self):
+        self.date = Datetime('2015/03/13', '17:00', '+00:00')
+        self.pos = GeoPos('38n32', '8w54')
+
+    def test_context_returns(self):
+        """Solar returns must use the context of the natal chart."""
+        flags = context.FLAGS | swisseph.FLG_TRUEPOS
+        ctx = context.EphemerisContext(flags=flags,
+                                       hsys=const.HOUSES_MORINUS)
+        config = essential.DignityConfig(terms=essential.LILLY_TERMS)
+        chart = Chart(self.date, self.pos, context=ctx, config=config)
+        sun = chart.getObject(const.SUN)
+        srChart = returns.nextSolarReturn(chart, Datetime('2020/01/01'))
+        self.assertIs(srChart.context, ctx)
+        self.assertIs(srChart.config, config)
+        self.assertEqual(srChart.hsys, const.HOUSES_MORINUS)
+        srSun = srChart.getObject(const.SUN)
+        self.assertLess(abs(angle.closestdistance(sun.lon, srSun.lon)),
+                        tools.MAX_ERROR)
+
+    def test_primary_directions(self):
+        """Primary directions must match the scalar arcs."""
+        chart = Chart(self.date, self.pos)
+        pd = primarydirections.PrimaryDirections(chart)
+        sigs = pd._elements(pd.SIG_OBJECTS + pd.SIG_ANGLES, pd.N, [0])
+        proms = (pd._elements(pd.SIG_OBJECTS, pd.N, const.MAJOR_ASPECTS) +
+                 pd._terms() +
+                 pd._elements(pd.SIG_OBJECTS, pd.A, [0]) +
+                 pd._elements(pd.SIG_OBJECTS, pd.C, [0]))
+        expected = []
+        for (prom, sig) in itertools.product(proms, sigs):
+            if prom['id'] == sig['id']:
+                continue
+            arcs = pd.getArc(prom, sig)
+            for (key, y) in [('arcm', 'M'), ('arcz', 'Z')]:
+                if 0 < arcs[key] < pd.MAX_ARC:
+                    expected.append([arcs[key], prom['id'], sig['id'], y])
+        self.assertEqual(pd.getList(const.MAJOR_ASPECTS), sorted(expected))
+
+    def test_pd_table_queries(self):
+        """Indexed table queries must match linear scans."""
+        chart = Chart(self.date, self.pos)
+        table = primarydirections.PDTable(chart)
+        for (arcmin, arcmax) in [(0, 10), (10.5, 30), (50, 200)]:
+            self.assertEqual(table.view(arcmin, arcmax),
+                             [d for d in table.table
+                              if arcmin < d[0] < arcmax])
+        for ID in [const.SUN, const.ASC, 'N_Moon_0', 'T_', 'Mar']:
+            self.assertEqual(table.bySignificator(ID),
+                             [d for d in table.table if ID in d[2]])
+            self.assertEqual(table.byPromissor(ID),
+                             [d for d in table.table if ID in d[1]])
+
+    def test_pd_table_dates(self):
+        """Direction dates must match the arcs of their keys."""
+        chart = Chart(self.date, self.pos)
+        table = primarydirections.PDTable(chart)
+        jd = self.date.jd
+        year = const.YEAR
+
+        dates = table.getDates(primarydirections.PTOLEMY)
+        for (direction, date) in zip(table.table, dates):
+            self.assertAlmostEqual((date.jd - jd) / year, direction[0],
+                                   places=3)
+
+        def sunRA(jd):
+            lon = swe.sweObjectLon(const.SUN, jd)
+            return utils.eqCoords(lon, 0)[0]
+
+        dates = table.getDates(primarydirections.TRUE_SOLAR_ARC)
+        for (direction, date) in list(zip(table.table, dates))[::25]:
+            years = (date.jd - jd) / year
+            arc = angle.distance(sunRA(jd), sunRA(jd + years))
+            self.assertAlmostEqual(arc, direction[0], places=3)
+
+    def test_pd_table_empty(self):
+        """Empty solar arc tables must raise ValueError."""
+        solarArcs = primarydirections.SolarArcTable(self.date.jd, 0)
+        with self.assertRaises(ValueError):
+            solarArcs.years(1.0)
+        with self.assertRaises(ValueError):
+            solarArcs.arc(1.0)
+
+        table = primarydirections.PDTable(Chart(self.date, self.pos))
+        table.table, table.arcs = [], []
+        key = primarydirections.TRUE_SOLAR_ARC
+        self.assertEqual(table.getDates(key), [])
+        self.assertEqual(table.viewDates(self.date, self.date, key), [])
+
+    def test_primary_directions_cache(self):
+        """Cached directions must match fresh directions."""
+        chart = Chart(self.date, self.pos)
+        pd = primarydirections.PrimaryDirections(chart)
+        pd.getList(const.MAJOR_ASPECTS)
+        pd.SIG_HOUSES = [const.HOUSE1, const.HOUSE10]
+        aspList = const.MAJOR_ASPECTS + [45]
+        fresh = primarydirections.PrimaryDirections(chart)
+        fresh.SIG_HOUSES = pd.SIG_HOUSES
+        self.assertEqual(pd.getList(aspList), fresh.getList(aspList))
+
+    def test_profection_timeline(self):
+        """Profection timelines must match profection charts."""
+        chart = Chart(self.date, self.pos)
+        timeline = profections.ProfectionTimeline(chart, 10)
+        jds = [self.date.jd + 100 + i * 365.25 / 2 for i in range(18)]
+        series = timeline.series(jds)
+        n = len(timeline.objects)
+        for (i, jd) in enumerate(jds):
+            date = Datetime.fromJD(jd, '+00:00')
+            pChart = profections.compute(chart, date)
+            lons = series['objects'][i * n: (i + 1) * n]
+            for (obj, lon) in zip(pChart.objects, lons):
+                self.assertAlmostEqual(angle.closestdistance(obj.lon, lon),
+                                       0, places=3)
+            self.assertEqual(list(lons), timeline.lons(jd)['objects'])
+
+        # Just after each solar return
+        for (i, jd) in enumerate(timeline.returns[1:-1], 1):
+            date = Datetime.fromJD(jd + 0.01, '+00:00')
+            pChart = profections.compute(chart, date)
+            sun = pChart.getObject(const.SUN)
+            rotation = timeline.rotation(jd + 0.01)
+            self.assertAlmostEqual(rotation, 30 * i, places=2)
+            dist = angle.closestdistance(sun.lon,
+                                         chart.getObject(const.SUN).lon)
+            self.assertAlmostEqual(dist, angle.closestdistance(rotation, 0),
+                                   places=2)